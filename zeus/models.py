@@ -3,6 +3,7 @@ from .app import db
 from os import getenv
 from uuid import uuid4
 from sqlalchemy.sql import func
+from sqlalchemy.orm import joinedload
 from .exceptions import ZeusCmdError
 from sqlalchemy.types import VARCHAR
 from sqlalchemy.ext.compiler import compiles
@@ -122,9 +123,20 @@ class User(db.Model, UserMixin):
         return Event.query.filter_by(user_id=self.id).filter_by(job_id=job_id)
 
     @hybrid_method
-    def active_org(self, org_type: str, org_id: str):
+    def active_org(self, org_type: str, org_id: str, with_oauth: bool = False):
+        """
+        Return the ProvisioningOrg instance of the provided type and id
+        owned by the user.
+
+        If `with_oauth` is True, the related OAuthApp is loaded in the same query
+        for callers that will access `org.oauth`.
+        """
+        orgs = self.orgs_of_type(org_type)
+        if with_oauth:
+            orgs = orgs.options(joinedload(ProvisioningOrg.oauth))
+
         active_org = next(
-            (org for org in self.orgs_of_type(org_type)
+            (org for org in orgs
              if str(org.id) == str(org_id)),
             None,
         )
@@ -266,6 +278,8 @@ class OAuthApp(db.Model):
             unique=True,
             postgresql_where=user_id.is_(None)
         ),
+        # Supports per-user lookups and the name-ordered oauth table
+        Index("ix_oauth_app_user_id_name", "user_id", "name"),
     )
 
     @classmethod
@@ -303,6 +317,12 @@ class ProvisioningOrg(db.Model):
     oauth = db.relationship("OAuthApp", back_populates="orgs")
     events = db.relationship("Event", back_populates="org")
 
+    __table_args__ = (
+        Index("ix_provisioning_org_user_id_org_type_id", "user_id", "org_type_id"),
+        # Supports the associated orgs check when an OAuth app is deleted
+        Index("ix_provisioning_org_oauth_id", "oauth_id"),
+    )
+
     @classmethod
     def create(cls, name, org_type, **kwargs):
         """
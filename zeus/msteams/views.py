@@ -147,7 +147,7 @@ class MsTeamsBulkEmergencyAddressView(MsTeamsBulkSubmitView):
 
 def msteams_org_credentials(org_id) -> dict:
     token_mgr = MsTeamsTokenMgr()
-    org = current_user.active_org(TOOL, org_id)
+    org = current_user.active_org(TOOL, org_id, with_oauth=True)
     try:
         return dict(
             access_token=token_mgr.access_token(org=org),
@@ -204,6 +204,7 @@ class BulkSvc:
      and return None if successful or
     raise a
     """
+    __slots__ = ("client", "model", "current", "rollback_tasks")
 
     def __init__(self, client, model, **kwargs):
         self.client = client
@@ -257,6 +258,7 @@ class BulkTask:
         model (DataTypeBase): data type model with workbook row data
         client: The tool's API client authenticated for the current org
     """
+    __slots__ = ("svc", "model", "client")
 
     def __init__(self, svc, **kwargs):
         self.svc: BulkSvc = svc
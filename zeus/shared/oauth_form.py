@@ -3,9 +3,10 @@ from flask_login import current_user
 from zeus.shared.helpers import deep_get
 from zeus.models import OAuthApp
 from sqlalchemy.sql.operators import ilike_op
-from wtforms.validators import DataRequired, StopValidation
+from wtforms.validators import DataRequired, Optional, StopValidation
 from wtforms import (
     Form,
+    IntegerField,
     StringField,
     SelectMultipleField,
 )
@@ -23,7 +24,7 @@ def oauth_name_validator(form, field):
 
 
 class UserOAuthFormBase(Form):
-    id = StringField("OAuth App Id", render_kw={"hidden": ""})
+    id = IntegerField("OAuth App Id", validators=[Optional()], render_kw={"hidden": ""})
     name = StringField(
         "Name", validators=[DataRequired(), oauth_name_validator], default=""
     )
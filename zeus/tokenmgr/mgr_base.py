@@ -202,7 +202,13 @@ class TokenMgrBase:
             return True
         return False
 
-    def auth_url(self, state: str, org: Org) -> str:
+    def auth_url(self, state: str, oauth_app) -> str:
+        """
+        Construct the authorization URL for the provided OAuth app.
+
+        Called for every row in the orgs table, so implementations should
+        only use attributes of the provided oauth_app and not make requests.
+        """
         raise NotImplementedError
 
     def access_token(self, **kwargs) -> str:
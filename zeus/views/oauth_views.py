@@ -40,8 +40,9 @@ class OAuthFormView(CRUDFormView):
 
     def build_update_form(self):
         self.form = update_oauth_form(request.form, self.tool, obj=self.record)
-        if hasattr(self.form, "scopes"):
-            self.form.scopes.data = self.record.scopes
+        scopes_field = getattr(self.form, "scopes", None)
+        if scopes_field is not None:
+            scopes_field.data = self.record.scopes
 
     @classmethod
     def register(cls, app, **kwargs):
@@ -78,10 +79,11 @@ class OAuthUpdateView(CRUDUpdateView):
         self.form = update_oauth_form(request.form, self.tool)
 
     def prepare_record(self):
-        self.record = lookup_oauth(int(self.form.id.data), self.tool)
+        self.record = lookup_oauth(self.form.id.data, self.tool)
         self.form.populate_obj(self.record)
-        if hasattr(self.form, "scopes"):
-            self.record.scopes = self.form.scopes.data
+        scopes_field = getattr(self.form, "scopes", None)
+        if scopes_field is not None:
+            self.record.scopes = scopes_field.data
 
     @classmethod
     def register(cls, app, **kwargs):
@@ -117,7 +119,8 @@ class OAuthCreateView(CRUDUpdateView):
         self.form = update_oauth_form(request.form, self.tool)
 
     def prepare_record(self):
-        scopes = self.form.scopes.data if hasattr(self.form, "scopes") else None
+        scopes_field = getattr(self.form, "scopes", None)
+        scopes = scopes_field.data if scopes_field is not None else None
 
         self.record = OAuthApp.create(
             org_type=self.tool,
@@ -186,9 +189,12 @@ def lookup_oauth(oauth_id, tool) -> OAuthApp:
     except Exception:
         raise ZeusCmdError(f"Invalid OAuth ID: '{oauth_id}'")
 
-    record = OAuthApp.query.filter(OAuthApp.user_id == current_user.id).filter(OAuthApp.id == _id).first()
+    # Primary key lookup uses the session identity map, so repeated lookups
+    # within a request do not issue another query. Ownership is checked here
+    # rather than in the WHERE clause.
+    record = OAuthApp.query.get(_id)
 
-    if not record:
+    if not record or record.user_id != current_user.id:
         raise ZeusCmdError(f"OAuth ID: {_id} Not Found")
 
     return record
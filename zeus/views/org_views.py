@@ -1,8 +1,10 @@
 import logging
+from zeus.app import db
+from collections import Counter
 from flask_security import current_user
 from zeus.exceptions import ZeusCmdError
 from zeus.models import ProvisioningOrg as Org, OAuthApp, OrgType
-from flask import session, request, make_response, url_for
+from flask import session, request, make_response, render_template, url_for
 from .base_views import ToolView, CRUDTableView, CRUDUpdateView, CRUDDeleteView, CRUDFormView
 
 log = logging.getLogger(__name__)
@@ -32,7 +34,7 @@ class OrgSelectView(ToolView):
 
     def process(self):
         key = f"{self.tool}org"
-        org = request.form.to_dict().get(key, "")
+        org = request.form.get(key, "")
         session[key] = org
 
     @classmethod
@@ -53,44 +55,75 @@ class OrgOAuthTabbedListView(CRUDTableView):
 
     Registration requires:
         tool: 'five9', 'zoom', etc.
-        token_mgr: TokenMgr class object
+        token_mgr: TokenMgr class object. Instantiated once when registered
         template: Optionally, override default template
     """
     def __init__(self, tool, token_mgr, **kwargs):
         super().__init__()
         self.tool = tool
-        self.TokenMgr = token_mgr
+        self.token_mgr = token_mgr
+        self.refresh_view = f"tokenmgr.{self.tool}_refresh"
         self.org_rows: list = []
         self.oauth_rows: list = []
         self.active_tab = request.args.get("active") or "orgs"
-        self.orgs = current_user.orgs_of_type(self.tool.title())
+        self.orgs = org_table_query(self.tool).all()
         self.template = kwargs.get("template") or "tool/orgs_and_oauth.html"
 
     def build_org_table_rows(self):
-        refresh_view = f"tokenmgr.{self.tool}_refresh"
-        token_mgr = self.TokenMgr()
         for org in self.orgs:
-            auth_url = token_mgr.auth_url(state=org.state, oauth_app=org.oauth)
+            auth_url = self.token_mgr.auth_url(state=org.state, oauth_app=org.OAuthApp)
             self.org_rows.append(
                 {
                     "id": org.id,
                     "name": org.name,
-                    "oauth_app": org.oauth.name,
+                    "oauth_app": org.OAuthApp.name,
                     "refresh_expires": org.refresh_expires,
                     "auth_url": auth_url,
-                    "refresh_url": url_for(refresh_view, id=org.id),
+                    "refresh_url": url_for(self.refresh_view, id=org.id),
                 }
             )
 
     def build_oauth_table_rows(self):
+        """
+        Select only the columns rendered in the oauth table. This avoids
+        hydrating full OAuthApp records, which decrypts the client secret
+        for every row.
+
+        User-defined apps can only be assigned to the user's own orgs of the
+        same type, so the associated org counts are taken from the org rows
+        already loaded by `self.orgs` rather than joined in this query.
+        """
+        org_counts = Counter(org.OAuthApp.id for org in self.orgs)
         query = (
-            OAuthApp.query
-            .join(OrgType)
-            .filter(OAuthApp.user == current_user)
+            db.session.query(OAuthApp.id, OAuthApp.name, OAuthApp.is_global)
+            .join(OrgType, OAuthApp.org_type)
+            .filter(OAuthApp.user_id == current_user.id)
             .filter(OrgType.name == self.tool)
             .order_by(OAuthApp.name)
         )
-        self.oauth_rows = query.all()
+        self.oauth_rows = [
+            {
+                "id": row.id,
+                "name": row.name,
+                "is_global": row.is_global,
+                "org_count": org_counts[row.id],
+            }
+            for row in query
+        ]
+
+    def get(self):
+        """
+        Render the page with a private ETag so repeat navigations with an
+        unchanged page get a 304 response without the page body.
+
+        The rendered page is not cached server-side since it includes
+        flashed messages.
+        """
+        self.process()
+        response = make_response(render_template(self.template, vm=self.context_vars()))
+        response.headers["Cache-Control"] = "private, no-cache"
+        response.add_etag()
+        return response.make_conditional(request)
 
     def process(self):
         """
@@ -102,7 +135,7 @@ class OrgOAuthTabbedListView(CRUDTableView):
 
     @classmethod
     def register(cls, app, token_mgr, **kwargs):
-        view = cls.as_view("orgs", app.name, token_mgr, **kwargs)
+        view = cls.as_view("orgs", app.name, token_mgr(), **kwargs)
         app.add_url_rule("/orgs", view_func=view)
 
 
@@ -118,36 +151,35 @@ class OrgListView(CRUDTableView):
 
     Registration requires:
         tool: 'five9', 'zoom', etc.
-        token_mgr: TokenMgr class object
+        token_mgr: TokenMgr class object. Instantiated once when registered
         template: Optionally, override default template
     """
     def __init__(self, tool, token_mgr, **kwargs):
         super().__init__()
         self.tool = tool
         self.org_rows: list = []
-        self.TokenMgr = token_mgr
-        self.orgs = current_user.orgs_of_type(self.tool.title())
+        self.token_mgr = token_mgr
+        self.refresh_view = f"tokenmgr.{self.tool}_refresh"
+        self.orgs = org_table_query(self.tool).all()
         self.template = kwargs.get("template") or "tool/orgs.html"
 
     def build_table_rows(self):
-        refresh_view = f"tokenmgr.{self.tool}_refresh"
-        token_mgr = self.TokenMgr()
         for org in self.orgs:
-            auth_url = token_mgr.auth_url(state=org.state, oauth_app=org.oauth)
+            auth_url = self.token_mgr.auth_url(state=org.state, oauth_app=org.OAuthApp)
             self.org_rows.append(
                 {
                     "id": org.id,
                     "name": org.name,
-                    "oauth_app": org.oauth.name,
+                    "oauth_app": org.OAuthApp.name,
                     "refresh_expires": org.refresh_expires,
                     "auth_url": auth_url,
-                    "refresh_url": url_for(refresh_view, id=org.id),
+                    "refresh_url": url_for(self.refresh_view, id=org.id),
                 }
             )
 
     @classmethod
     def register(cls, app, token_mgr, **kwargs):
-        view = cls.as_view("orgs", app.name, token_mgr, **kwargs)
+        view = cls.as_view("orgs", app.name, token_mgr(), **kwargs)
         app.add_url_rule("/orgs", view_func=view)
 
 
@@ -185,7 +217,7 @@ class OrgFormView(CRUDFormView):
     def build_update_form(self):
         self.form = self.form_cls(request.form, obj=self.record)
         if hasattr(self.form, "oauth_app"):
-            self.form.oauth_app.data = str(self.record.oauth_id)
+            self.form.oauth_app.data = self.record.oauth_id
 
     @classmethod
     def register(cls, app, form_cls, **kwargs):
@@ -234,10 +266,10 @@ class OrgUpdateView(CRUDUpdateView):
         pass
 
     def prepare_record(self):
-        self.record = lookup_org(int(self.form.id.data), self.tool)
+        self.record = lookup_org(self.form.id.data, self.tool)
         self.form.populate_obj(self.record)
         if hasattr(self.form, "oauth_app"):
-            self.record.oauth_id = int(self.form.oauth_app.data)
+            self.record.oauth_id = self.form.oauth_app.data
 
     @classmethod
     def register(cls, app, form_cls, **kwargs):
@@ -341,13 +373,37 @@ class OrgDeleteView(CRUDDeleteView):
         app.add_url_rule("/orgs/delete", view_func=view)
 
 
-def lookup_org(org_id, tool) -> Org:
+def org_table_query(tool):
+    """
+    Query for the current user's orgs of the provided tool type with only
+    the columns rendered in the orgs table.
+
+    The related OAuthApp is loaded in the same query, since it is needed to
+    build the authorization URL, to avoid a lazy load for every row.
+    """
+    return (
+        db.session.query(
+            Org.id,
+            Org.name,
+            Org.state,
+            Org.refresh_expires,
+            OAuthApp,
+        )
+        .join(OrgType, Org.org_type)
+        .join(OAuthApp, Org.oauth)
+        .filter(Org.user_id == current_user.id)
+        .filter(OrgType.name == tool)
+        .order_by(Org.id)
+    )
+
+
+def lookup_org(org_id, tool, with_oauth=False) -> Org:
     try:
         org_id = int(org_id)
     except Exception:
         raise ZeusCmdError(f"Invalid Org ID: '{org_id}'")
 
-    org = current_user.active_org(org_type=f"{tool.title()}", org_id=org_id)
+    org = current_user.active_org(org_type=f"{tool.title()}", org_id=org_id, with_oauth=with_oauth)
 
     if not org:
         raise ZeusCmdError(f"Org ID: {org_id} Not Found")
@@ -1,4 +1,5 @@
 from typing import List
+from functools import cached_property
 from zeus.shared.helpers import deep_get
 import logging
 
@@ -38,6 +39,7 @@ class TemplateTableCol:
         self._title: str = title
         self.default: str = default
         self.path = path or name
+        self._path_parts: tuple = tuple(self.path.split("."))
         self.hidden: bool = hidden
         self._sortable: bool = sortable
         self._searchable: bool = searchable
@@ -46,20 +48,22 @@ class TemplateTableCol:
         self.detail_data_type: str = detail_data_type
         self.grid_track = grid_track or "minmax(min-content, auto)"
 
-    @property
+    @cached_property
     def sortable(self):
         return str(self._sortable).lower()
 
-    @property
+    @cached_property
     def searchable(self):
         return str(self._searchable).lower()
 
-    @property
+    @cached_property
     def title(self):
         """
         Provides the inner text of the <th> element.
         If a title argument was provided to the constructor, that value is used.
         Otherwise, replace underscores with spaces in the name attribute and use this.
+
+        Cached since the value is read every time the table header is rendered.
         """
         if self._title:
             title = self._title
@@ -74,12 +78,14 @@ class TemplateTableCol:
         based on the row object provided.
 
         By default, will use self.path to deep_get a value form the row.
+        The path is split once in the constructor so it is not re-parsed
+        for every cell.
         If a custom value_getter callable was provided, this is used instead.
         """
         if self.value_getter:
             return self.value_getter(row)
 
-        return deep_get(row, self.path, default=self.default)
+        return deep_get(row, self._path_parts, default=self.default)
 
 
 class TemplateTable:
@@ -113,7 +119,7 @@ class TemplateTable:
         self._rows = rows
 
 
-def bulk_table_columns(model) -> list[TemplateTableCol]:
+def bulk_table_columns(model, schema=None) -> list[TemplateTableCol]:
     """
     Create TemplateTableCol instances for a bulk table using the fields in the
     provided data type model class.
@@ -123,14 +129,16 @@ def bulk_table_columns(model) -> list[TemplateTableCol]:
 
     Args:
         model (Type[DataTypeBase]): Data type model class
+        schema (dict, None): Optional, the model schema if the caller already has it
 
     Returns:
         columns: (list[TemplateTableCol])
     """
-    id_field = model.schema()["id_field"]
+    schema = schema or model.schema()
+    id_field = schema["id_field"]
     columns = [TemplateTableCol("action", grid_track="90px")]
 
-    for name, field in model.schema()["properties"].items():
+    for name, field in schema["properties"].items():
         wb_key = field.get("wb_key")
 
         if not wb_key or name == "action":
@@ -154,17 +162,14 @@ def default_bulk_table(model, rows=None) -> TemplateTable:
     Identify the id field (name usually) and set the grid-track
     to max-content to prevent word wrapping for this column.
     """
-    id_field = model.schema()["id_field"]
-    data_type = model.schema()["data_type"]
-    title = model.schema()["title"]
-
-    columns = bulk_table_columns(model)
+    schema = model.schema()
+    columns = bulk_table_columns(model, schema=schema)
 
     return TemplateTable(
-        data_type=data_type,
+        data_type=schema["data_type"],
         columns=columns,
         rows=rows,
-        title=title,
+        title=schema["title"],
     )
 
 
@@ -173,7 +178,7 @@ def bulk_table(data_type, columns, rows=None, title=None) -> TemplateTable:
     Helper function to create a custom bulk TemplateTable.
     Insert an action column if it does not already exist
     """
-    if "action" not in [col.name for col in columns]:
+    if not any(col.name == "action" for col in columns):
         columns.insert(0, TemplateTableCol("action", grid_track="90px"))
 
     return TemplateTable(data_type, columns, rows, title=title)
@@ -202,7 +207,7 @@ def default_browse_table(model, rows=None) -> TemplateTable:
         if field.required and name != "action":
             columns.append(TemplateTableCol(name=name))
 
-    if rows and all(["detail_id" in row for row in rows]):
+    if rows and all("detail_id" in row for row in rows):
         columns.extend(detail_columns(data_type))
 
     return TemplateTable(
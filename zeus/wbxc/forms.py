@@ -2,8 +2,16 @@ from flask import current_app
 from flask_login import current_user
 from zeus.exceptions import ZeusCmdError
 from zeus.models import OAuthApp, OrgType
-from wtforms.validators import DataRequired
-from wtforms import Form, StringField, SelectField
+from wtforms.validators import DataRequired, Optional
+from wtforms import Form, IntegerField, StringField, SelectField
+
+
+class _WbxcOrgForm(Form):
+    id = IntegerField("Org Id", validators=[Optional()], render_kw={"hidden": ""})
+    name = StringField(
+        "Name", validators=[DataRequired("Org Name is Required")], default=""
+    )
+    oauth_app = SelectField("OAuth App", choices=[], coerce=int)
 
 
 def WbxcOrgForm(*args, **kwargs):
@@ -13,17 +21,9 @@ def WbxcOrgForm(*args, **kwargs):
     For Wbxc, users should be allowed to choose global apps
     or Oauth apps they've created.
     """
-    choices = get_wbxc_oauth_choices()
-
-    class _WbxcOrgForm(Form):
-
-        id = StringField("Org Id", render_kw={"hidden": ""})
-        name = StringField(
-            "Name", validators=[DataRequired("Org Name is Required")], default=""
-        )
-        oauth_app = SelectField("OAuth App", choices=choices)
-
-    return _WbxcOrgForm(*args, **kwargs)
+    form = _WbxcOrgForm(*args, **kwargs)
+    form.oauth_app.choices = get_wbxc_oauth_choices()
+    return form
 
 
 def get_wbxc_oauth_choices() -> list[tuple[int, str]]:
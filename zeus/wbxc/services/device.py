@@ -1,20 +1,28 @@
 import re
 import time
 import logging
+from collections import defaultdict, deque
+from operator import itemgetter
+from itertools import product
+from functools import cached_property, partial
 from pydantic import BaseModel, Field
-from ...shared.helpers import deep_get
+from ...shared.helpers import NODEFAULT
 from zeus.shared import request_builder as rb
 from zeus import registry as reg
 from zeus.exceptions import ZeusBulkOpFailed
 from zeus.wbxc.wbxc_models import devices as wm
+from zeus.shared.data_type_models import to_wb_str
 from zeus.wbxc.wbxc_simple import WbxcSimpleClient, WbxcServerFault
-from .supported_devices import build_supported_devices_map, normalized_model
+from .supported_devices import supported_devices_map, normalized_model, number_of_line_key_buttons
 from zeus.services import BrowseSvc, ExportSvc, DetailSvc, UploadTask, RowLoadResp
-from .shared import WbxcBulkSvc, WbxcLookup, WbxcBulkTask, build_number_lookup_params
+from .shared import WbxcBulkSvc, WbxcLookup, WbxcBulkTask, map_concurrently
 from .device_settings import WbxcDeviceSettingsModelBuilder
 
 log = logging.getLogger(__name__)
 
+kem_model_rgx = re.compile(r"KEM_(\d+)")
+line_type_col_rgx = re.compile(r"Line\s(\d+)\sType", re.I)
+
 
 class NumberLookup(BaseModel):
     """Represents the details necessary to assign a Webex Number as a device member."""
@@ -28,11 +36,13 @@ class NumberLookup(BaseModel):
 
     @classmethod
     def model_from_resp(cls, resp: dict):
+        owner = resp.get("owner") or {}
+        location = resp.get("location") or {}
         return cls(
-            owner_id=deep_get(resp, "owner.id"),
-            owner_type=deep_get(resp, "owner.type"),
-            location_id=deep_get(resp, "location.id"),
-            location_name=deep_get(resp, "location.name"),
+            owner_id=owner.get("id"),
+            owner_type=owner.get("type"),
+            location_id=location.get("id"),
+            location_name=location.get("name"),
             **resp,
         )
 
@@ -69,21 +79,25 @@ class CurrentMember(BaseModel):
 class WbxcDeviceBulkSvc(WbxcBulkSvc):
     """Attributes and methods common to the CREATE and UPDATE services."""
 
+    # Support data keyed by normalized model string, shared by all rows in the process
+    _model_support_cache: dict[str, dict] = {}
+
     def __init__(self, client, model, **kwargs):
         super().__init__(client, model, **kwargs)
         self.model: wm.WbxcDevice = model
         self.current_members: list[CurrentMember] = []
+        self.current_members_by_id: dict[str, CurrentMember] = {}
+        self.current_members_by_port: dict[int, CurrentMember] = {}
         self.current_layout: dict = {}
         self.member_numbers: dict[str, NumberLookup] = {}
-        self._model_support_data: dict = {}
 
     @property
     def model_support_data(self) -> dict:
-        if not self._model_support_data:
-            model_str = normalized_model(self.model.model)
-            supported_devices = build_supported_devices_map()
-            self._model_support_data = supported_devices.get(model_str, {})
-        return self._model_support_data
+        model_str = normalized_model(self.model.model)
+        if model_str not in self._model_support_cache:
+            supported_devices = supported_devices_map()
+            self._model_support_cache[model_str] = supported_devices.get(model_str, {})
+        return self._model_support_cache[model_str]
 
     @property
     def current_owner_id(self):
@@ -93,29 +107,32 @@ class WbxcDeviceBulkSvc(WbxcBulkSvc):
             return self.current["workspaceId"]
 
     def get_current_members(self):
-        """Get the current member line appearances assigned to the device."""
+        """
+        Get the current member line appearances assigned to the device.
+        Index the members by id and port for lookups while building the payload.
+        """
 
         for resp in self.client.device_members.get(self.current["id"])["members"]:
-            self.current_members.append(CurrentMember(**resp))
+            member = CurrentMember(**resp)
+            self.current_members.append(member)
+            self.current_members_by_id.setdefault(member.id, member)
+            self.current_members_by_port.setdefault(member.port, member)
 
     def get_member_numbers(self):
         """
         Lookup member number details for the line appearances of type: 'line' or 'primary'.
         This allows the request to fail before any change occurs if a number does not exist.
-        """
-        for line in self.model.lines:
-            if line.type in ("primary", "line"):
-                self.member_numbers[line.number] = self.lookup_member_number(line.number)
 
-    def lookup_member_number(self, number):
-        for params in build_number_lookup_params(number):
-            try:
-                resp = self.lookup.number(**params)
-                return NumberLookup.model_from_resp(resp)
-            except ZeusBulkOpFailed:
-                continue
+        Each unique number is looked up once and the lookups are sent concurrently.
+        """
+        numbers = [line.number for line in self.model.lines if line.type in ("primary", "line")]
+        responses = self.lookup.numbers_by_any(numbers, raise_missing=False)
+        for number in numbers:
+            if number not in responses:
+                raise ZeusBulkOpFailed(f"Number: {number} not found in available lines for {self.model.mac}")
 
-        raise ZeusBulkOpFailed(f"Number: {number} not found in available lines for {self.model.mac}")
+        for number, resp in responses.items():
+            self.member_numbers[number] = NumberLookup.model_from_resp(resp)
 
     def verify_line_1_number_is_not_changed(self):
         """
@@ -129,9 +146,7 @@ class WbxcDeviceBulkSvc(WbxcBulkSvc):
             (line for line in self.model.lines if line.idx == 1),
             None,
         )
-        current_line1 = next(
-            (line for line in self.current_members if line.port == 1), None
-        )
+        current_line1 = self.current_members_by_port.get(1)
 
         if line1_model and current_line1:
             line1_member = self.member_numbers.get(line1_model.number)
@@ -168,7 +183,7 @@ class WbxcDeviceBulkSvc(WbxcBulkSvc):
                     f"Cannot determine line key count for model: {self.model.model}"
                 )
 
-            if self.model.expansion_module not in support_data.get("kemModuleType", []):
+            if self.model.expansion_module not in support_data["kemModuleType"]:
                 raise ZeusBulkOpFailed(
                     f"Expansion module: {self.model.expansion_module} not supported for model: {self.model.model}"
                 )
@@ -333,6 +348,7 @@ class WbxcDeviceMembersUpdateTask(WbxcBulkTask):
         super().__init__(svc, **kwargs)
         self.svc: WbxcDeviceBulkSvc = svc
         self.has_run = False
+        self.primary_line_count = sum(1 for line in self.model.lines if line.type == "primary")
         self.member_payload_fields = [
             rb.RequiredField("allowCallDeclineEnabled", "allow_decline"),
             rb.RequiredField("hotlineEnabled", "hotline_enabled"),
@@ -345,6 +361,7 @@ class WbxcDeviceMembersUpdateTask(WbxcBulkTask):
             rb.ValuedField("hotlineDestination", "hotline_destination"),
             rb.ValuedField("t38FaxCompressionEnabled", "t38_enabled"),
         ]
+        self.member_payload_builder = partial(rb.RequestBuilder, fields=self.member_payload_fields)
 
     @property
     def is_model_ata(self) -> bool:
@@ -366,18 +383,22 @@ class WbxcDeviceMembersUpdateTask(WbxcBulkTask):
         value.
         """
         members = []
+        has_line1 = False
         for line in self.model.lines:
-            if line.type not in ("line", "primary"):
+            line_type, idx = line.type, line.idx
+            if line_type not in ("line", "primary"):
                 continue
 
-            if line.type == "primary" and line.idx != 1:
+            if line_type == "primary" and idx != 1:
                 continue
 
-            member_payload = self.build_line_payload(line)
-            members.append(member_payload)
+            members.append(self.build_line_payload(line))
+            if idx == 1:
+                has_line1 = True
 
         if members:
-            self.ensure_payload_includes_line1(members)
+            if not has_line1:
+                self.ensure_payload_includes_line1(members)
             return {"members": members}
 
         return {}
@@ -398,12 +419,9 @@ class WbxcDeviceMembersUpdateTask(WbxcBulkTask):
         """
         line_weight = self.get_line_weight(line_model.idx)
         number = self.svc.member_numbers[line_model.number]
-        member_details = next(
-            (m for m in self.svc.current_members if m.id == number.owner_id), None
-        )
+        member_details = self.svc.current_members_by_id.get(number.owner_id)
         if member_details:
-            member_payload = rb.RequestBuilder(
-                fields=self.member_payload_fields,
+            member_payload = self.member_payload_builder(
                 data=line_model.to_payload(drop_unset=True),
                 current=member_details.dict(),
                 lineWeight=line_weight,
@@ -411,10 +429,9 @@ class WbxcDeviceMembersUpdateTask(WbxcBulkTask):
 
         else:
             member_details = self.member_search(number)
-            primary_owner = True if self.svc.current_owner_id == number.owner_id else False
+            primary_owner = self.svc.current_owner_id == number.owner_id
 
-            member_payload = rb.RequestBuilder(
-                fields=self.member_payload_fields,
+            member_payload = self.member_payload_builder(
                 data=line_model.to_payload(drop_unset=True),
                 current=member_details,
                 lineWeight=line_weight,
@@ -449,10 +466,7 @@ class WbxcDeviceMembersUpdateTask(WbxcBulkTask):
         Otherwise, the lineWeight is always 1
         """
         if line_idx == 1:
-            primary_lines = len(
-                [line for line in self.model.lines if line.type == "primary"]
-            )
-            return primary_lines or 1
+            return self.primary_line_count or 1
         return 1
 
     def member_search(self, number: NumberLookup) -> dict:
@@ -472,19 +486,17 @@ class WbxcDeviceMembersUpdateTask(WbxcBulkTask):
 
     def ensure_payload_includes_line1(self, members: list[dict]):
         """
-        Ensure the payload includes an entry for line 1. If not (because it was not
-        specified in the worksheet row), Create an entry for it from the current
-        member and add this to the list of members.
+        Add an entry for line 1 to the members when it was not specified in the
+        worksheet row. The entry is created from the current line 1 member.
+        Only called by `build_payload` when the members do not include line 1.
 
         The lineWeight does not need to be checked because the model validates that
         line 1 is present if multiple primary lines are defined.
         """
-        payload_line_1 = next((m for m in members if m["port"] == 1), None)
-        current_line_1 = next((m for m in self.svc.current_members if m.port == 1), None)
-        if current_line_1 and not payload_line_1:
+        current_line_1 = self.svc.current_members_by_port.get(1)
+        if current_line_1:
             members.append(
-                rb.RequestBuilder(
-                    fields=self.member_payload_fields,
+                self.member_payload_builder(
                     data={},
                     current=current_line_1.dict(),
                 ).payload()
@@ -506,7 +518,7 @@ class WbxcDeviceLayoutUpdateTask(WbxcBulkTask):
         self.has_run = False
         self.default_mode_payload = {"layoutMode": "DEFAULT", "userReorderEnabled": False}
 
-    @property
+    @cached_property
     def supported_line_count(self) -> int:
         """
         Return the number of supported lines based on the supported devices data.
@@ -517,7 +529,7 @@ class WbxcDeviceLayoutUpdateTask(WbxcBulkTask):
         data = self.svc.model_support_data
         return data.get("numberOfLineKeyButtons") or data.get("numberOfLinePorts") or 1
 
-    @property
+    @cached_property
     def kem_line_count(self) -> int:
         """Return the number of lines on the KEM module specified in the model."""
         line_count = 0
@@ -525,7 +537,7 @@ class WbxcDeviceLayoutUpdateTask(WbxcBulkTask):
         if self.model.expansion_module:
             try:
                 line_count = int(
-                    re.search(r"KEM_(\d+)", self.model.expansion_module).group(1)
+                    kem_model_rgx.search(self.model.expansion_module).group(1)
                 )
             except Exception as exc:
                 raise ZeusBulkOpFailed(
@@ -534,7 +546,8 @@ class WbxcDeviceLayoutUpdateTask(WbxcBulkTask):
 
         return line_count
 
-    def build_line_key_layout_template(self) -> dict:
+    @cached_property
+    def line_key_template(self) -> dict:
         """
         Create a template for the new layout payload
         If the current layout is customized, use this to create the template.
@@ -542,13 +555,17 @@ class WbxcDeviceLayoutUpdateTask(WbxcBulkTask):
         supports, so use the constant dict to get the # of lines and build a template
         with all line types 'open'
 
+        Entries are inserted in line index order so the payload can be built
+        from the dict values without sorting.
+
         Returns:
             (dict): key is the line index, value is a line key template dictionary.
         """
-        current_layout = deep_get(self.svc, "current_layout.lineKeys", default=[])
+        current_layout = (self.svc.current_layout or {}).get("lineKeys") or []
 
         if current_layout:
-            template = {entry["lineKeyIndex"]: entry for entry in current_layout}
+            ordered = sorted(current_layout, key=itemgetter("lineKeyIndex"))
+            template = {entry["lineKeyIndex"]: entry for entry in ordered}
 
         else:
             template = {1: {"lineKeyIndex": 1, "lineKeyType": "PRIMARY_LINE"}}
@@ -558,22 +575,17 @@ class WbxcDeviceLayoutUpdateTask(WbxcBulkTask):
 
         return template
 
-    def build_kem_layout_template(self):
-        kem_layout = {}
-        line_idx = self.supported_line_count + 1
+    @cached_property
+    def kem_key_template(self) -> dict:
+        """Create a template for the KEM keys with all key types 'OPEN'."""
         kem_count = self.svc.model_support_data["kemModuleCount"]
         total_lines_for_kem = self.kem_line_count * 2
+        kem_keys = product(range(1, kem_count + 1), range(1, total_lines_for_kem + 1))
 
-        for kem_idx in range(1, kem_count + 1):
-            for key_idx in range(1, total_lines_for_kem + 1):
-                kem_layout[line_idx] = {
-                    "kemModuleIndex": kem_idx,
-                    "kemKeyIndex": key_idx,
-                    "kemKeyType": "OPEN",
-                }
-                line_idx += 1
-
-        return kem_layout
+        return {
+            line_idx: {"kemModuleIndex": kem_idx, "kemKeyIndex": key_idx, "kemKeyType": "OPEN"}
+            for line_idx, (kem_idx, key_idx) in enumerate(kem_keys, start=self.supported_line_count + 1)
+        }
 
     def run(self):
         payload = self.build_payload()
@@ -582,67 +594,88 @@ class WbxcDeviceLayoutUpdateTask(WbxcBulkTask):
 
     def build_payload(self):
         if self.model.is_custom_layout:
+            line_keys, kem_keys = self.build_custom_keys_payloads()
             payload = {
                 "layoutMode": "CUSTOM",
-                "lineKeys": self.build_custom_line_keys_payload(),
+                "lineKeys": line_keys,
             }
 
             if self.model.expansion_module:
                 payload["kemModuleType"] = self.model.expansion_module
-                payload["kemKeys"] = self.build_custom_kem_keys_payload()
+                payload["kemKeys"] = kem_keys
         else:
             payload = self.default_mode_payload
 
         return payload
 
-    def build_custom_line_keys_payload(self):
-        template = self.build_line_key_layout_template()
-        next_shared_line_index = 1
+    def build_custom_keys_payloads(self) -> tuple[list, list]:
+        """
+        Build the lineKeys and kemKeys payloads in a single pass over the model lines.
+        Each line is applied to the line key template and/or the KEM template
+        that includes its index.
+
+        Returns:
+            (tuple): lineKeys payload list and kemKeys payload list
+        """
+        line_template = self.line_key_template
+        kem_template = self.kem_key_template if self.model.expansion_module else {}
         shared_line_indexes_by_number = {}
-        for line in self.model.lines:
-            if line.idx == 1:
-                continue  # Line 1 should always be primary, do not attempt to modify
 
-            if line.idx not in template:
-                continue
+        apply_line_key, apply_kem_key = self.apply_line_key, self.apply_kem_key
 
-            api_line_type = get_api_line_type(line.type)
-            entry = {"lineKeyIndex": line.idx, "lineKeyType": api_line_type}
+        for line in self.model.lines:
+            idx = line.idx
+            if idx in line_template:
+                apply_line_key(line, line_template, shared_line_indexes_by_number)
 
-            # Each unique shared line must have a sharedLineKeyIndex.
-            # This is incremented for each unique shared line.
-            # If a number has multiple appearances, the same sharedLineIndex must be used
-            if api_line_type == "SHARED_LINE":
-                if line.number not in shared_line_indexes_by_number:
-                    shared_line_indexes_by_number[line.number] = next_shared_line_index
-                    next_shared_line_index += 1
+            if idx in kem_template:
+                apply_kem_key(line, kem_template)
 
-                shared_line_index = shared_line_indexes_by_number[line.number]
+        line_keys = list(line_template.values())
+        kem_keys = list(kem_template.values())
+        return line_keys, kem_keys
 
-                entry["sharedLineIndex"] = shared_line_index
+    @staticmethod
+    def apply_line_key(line: wm.WbxcDeviceLine, template: dict, shared_line_indexes_by_number: dict):
+        """
+        Update the line key template entry for the provided line.
 
-            elif line.type == "sd":
-                entry["lineKeyValue"] = line.number
-                entry["lineKeyLabel"] = line.label
+        Args:
+            line (WbxcDeviceLine): Line model with an idx present in the template
+            template (dict): Line key template keyed by line index
+            shared_line_indexes_by_number (dict): sharedLineIndex values assigned so far
+        """
+        idx, line_type, number = line.idx, line.type, line.number
+        if idx == 1:
+            return  # Line 1 should always be primary, do not attempt to modify
 
-            template[line.idx] = entry
+        api_line_type = get_api_line_type(line_type)
+        entry = {"lineKeyIndex": idx, "lineKeyType": api_line_type}
 
-        return [template[idx] for idx in sorted(template)]
+        # Each unique shared line must have a sharedLineKeyIndex.
+        # This is incremented for each unique shared line.
+        # If a number has multiple appearances, the same sharedLineIndex must be used
+        if api_line_type == "SHARED_LINE":
+            if number not in shared_line_indexes_by_number:
+                shared_line_indexes_by_number[number] = len(shared_line_indexes_by_number) + 1
 
-    def build_custom_kem_keys_payload(self):
-        template = self.build_kem_layout_template()
-        for line in self.model.lines:
-            if line.idx not in template:
-                continue
+            entry["sharedLineIndex"] = shared_line_indexes_by_number[number]
+
+        elif line_type == "sd":
+            entry["lineKeyValue"] = number
+            entry["lineKeyLabel"] = line.label
 
-            api_line_type = get_api_line_type(line.type)
-            template[line.idx]["kemKeyType"] = api_line_type
+        template[idx] = entry
 
-            if line.type == "sd":
-                template[line.idx]["kemKeyValue"] = line.number
-                template[line.idx]["kemKeyLabel"] = line.label
+    @staticmethod
+    def apply_kem_key(line: wm.WbxcDeviceLine, template: dict):
+        """Update the KEM template entry for the provided line."""
+        entry = template[line.idx]
+        entry["kemKeyType"] = get_api_line_type(line.type)
 
-        return [template[idx] for idx in sorted(template)]
+        if line.type == "sd":
+            entry["kemKeyValue"] = line.number
+            entry["kemKeyLabel"] = line.label
 
     def rollback(self):
         if self.svc.current_layout:
@@ -679,7 +712,7 @@ class WbxcDeviceUploadTask(UploadTask):
         """Create LineAppearance models for each set of Line X columns in the row."""
         lines = []
         for key in row:
-            if m := re.search(r"Line\s(\d+)\sType", key, re.I):
+            if m := line_type_col_rgx.search(key):
 
                 if not row[key]:
                     continue
@@ -688,8 +721,9 @@ class WbxcDeviceUploadTask(UploadTask):
                 obj = {"idx": idx}
 
                 for wb_key, field in wm.WbxcDeviceLine.indexed_wb_keys(idx).items():
-                    if wb_key in row:
-                        obj[field.name] = row[wb_key]
+                    value = row.get(wb_key, NODEFAULT)
+                    if value is not NODEFAULT:
+                        obj[field.name] = value
 
                 lines.append(wm.WbxcDeviceLine.parse_obj(obj))
 
@@ -704,8 +738,7 @@ class WbxcDevicesBrowseSvc(BrowseSvc):
 
         params = {"type": "phone"}
         for resp in self.client.devices.list(**params):
-            model = builder.build_model(resp)
-            row = model.dict()
+            row = builder.browse_data(resp)
             row["detail_id"] = resp["id"]
             rows.append(row)
 
@@ -733,7 +766,10 @@ class WbxcDevicesExportTask(ExportSvc):
         builder = WbxcDeviceModelBuilder(self.client)
 
         params = {"type": "phone"}
-        for resp in self.client.devices.list(**params):
+        devices = list(self.client.devices.list(**params))
+        builder.prefetch_assignees(devices)
+
+        for resp in devices:
 
             try:
                 model = builder.build_export_model(resp)
@@ -763,6 +799,7 @@ class WbxcDeviceModelBuilder:
         self.client: WbxcSimpleClient = client
         self.lookup = WbxcLookup(client)
         self._model_support_data: dict = {}
+        self.assignees_by_owner_id: dict[str, str] = {}
 
     def build_model(self, resp: dict):
         return wm.WbxcDevice.safe_build(**self.summary_data(resp))
@@ -779,6 +816,30 @@ class WbxcDeviceModelBuilder:
         details["settings"] = self.build_device_settings(resp)
         return details
 
+    def prefetch_assignees(self, devices: list[dict]):
+        """
+        Resolve the assignee for each unique device owner concurrently so
+        `get_assignee` can use the cached values instead of making a request per device.
+
+        Errors are ignored here. Owners that fail to resolve are not cached,
+        so `get_assignee` will request them again and the error is reported
+        for the device.
+        """
+        owners = {}
+        for resp in devices:
+            if resp.get("personId"):
+                owners[resp["personId"]] = self.get_user_assignee
+            elif resp.get("workspaceId"):
+                owners[resp["workspaceId"]] = self.get_workspace_assignee
+
+        def resolve(owner_id):
+            try:
+                owners[owner_id](owner_id)
+            except Exception:
+                pass
+
+        map_concurrently(resolve, list(owners))
+
     def get_assignee(self, resp: dict):
         assignee = ""
 
@@ -790,12 +851,21 @@ class WbxcDeviceModelBuilder:
         return assignee
 
     def get_user_assignee(self, person_id: str) -> str:
+        """
+        Return the email of the person that owns the device.
+        Results are cached since multiple devices can share an owner.
+        """
+        if person_id in self.assignees_by_owner_id:
+            return self.assignees_by_owner_id[person_id]
+
         try:
             person = self.client.users.get(person_id, callingData=True)
         except WbxcServerFault:
             return ""
 
-        return person.get("emails", [])[0]
+        assignee = person.get("emails", [])[0]
+        self.assignees_by_owner_id[person_id] = assignee
+        return assignee
 
     def get_workspace_assignee(self, workspace_id: str) -> str:
         """
@@ -807,7 +877,11 @@ class WbxcDeviceModelBuilder:
 
         If neither a phone number nor extension are found, it is likely a hot-desk only
         device. In this case, there is no choice but to get the workspace name.
+
+        Results are cached since multiple devices can share a workspace.
         """
+        if workspace_id in self.assignees_by_owner_id:
+            return self.assignees_by_owner_id[workspace_id]
 
         try:
             assign_num_resp = self.client.workspace_associated_numbers.get(workspace_id)
@@ -821,6 +895,7 @@ class WbxcDeviceModelBuilder:
             ws_resp = self.client.workspaces.get(workspace_id)
             assignee = ws_resp["displayName"]
 
+        self.assignees_by_owner_id[workspace_id] = assignee
         return assignee
 
     def get_layout(self, resp: dict):
@@ -840,6 +915,13 @@ class WbxcDeviceModelBuilder:
             tags=",".join(str(tag) for tag in resp.get("tags", [])),
         )
 
+    def browse_data(self, resp: dict) -> dict:
+        """
+        Return only the values shown in the browse table, converted to their
+        workbook representation, without building and serializing a full WbxcDevice model.
+        """
+        return {key: to_wb_str(value) for key, value in self.summary_data(resp).items()}
+
     def build_device_settings(self, resp: dict):
         builder = WbxcDeviceSettingsModelBuilder(self.client)
         return builder.build_model(resp).dict()
@@ -857,12 +939,12 @@ class WbxcDeviceLayoutBuilder:
         self.client = client
         self.layout_resp: dict = {}
         self.members_resp: dict = {}
-        self.positions_by_type: dict[str, list[int]] = {}
+        self.positions_by_type: dict[str, deque[int]] = {}
         self._models_by_pos: dict[int, wm.WbxcDeviceLine] = {}
 
     def _build_positions_by_type(self, resp):
         """
-        Create a list of line positions for each line type
+        Create a queue of line positions for each line type
         in a custom layout in order to assign those positions
         as requested.
 
@@ -872,28 +954,28 @@ class WbxcDeviceLayoutBuilder:
         line_keys = self.layout_resp.get("lineKeys", [])
 
         if not line_keys:
-            self.positions_by_type["OPEN"] = list(range(1, 129))
+            self.positions_by_type["OPEN"] = deque(range(1, 129))
             return
 
         kem_keys = self.layout_resp.get("kemKeys", [])
         kem_idx_base = self.get_number_of_phone_buttons(resp["product"])
 
+        # Positions are collected in sets so duplicate indexes are dropped
+        # without a membership scan, then sorted once per line type.
+        positions: dict[str, set[int]] = defaultdict(set)
+
         for item in line_keys:
-            idx = item["lineKeyIndex"]
-            for_type = self.positions_by_type.setdefault(item["lineKeyType"], [])
-            if idx not in for_type:
-                for_type.append(idx)
-                for_type.sort()
+            positions[item["lineKeyType"]].add(item["lineKeyIndex"])
 
         for item in kem_keys:
-            idx = kem_idx_base + item["kemKeyIndex"]
-            for_type = self.positions_by_type.setdefault(item["kemKeyType"], [])
-            if idx not in for_type:
-                for_type.append(idx)
-                for_type.sort()
+            positions[item["kemKeyType"]].add(kem_idx_base + item["kemKeyIndex"])
+
+        self.positions_by_type = {
+            line_type: deque(sorted(for_type)) for line_type, for_type in positions.items()
+        }
 
     @staticmethod
-    def get_number_of_phone_buttons(phone_model: str):
+    def get_number_of_phone_buttons(phone_model: str) -> int:
         """
         Return the numberOfLineKeyButtons on the phone model for use
         to determine the position of kem lines.
@@ -903,14 +985,10 @@ class WbxcDeviceLayoutBuilder:
         the best guess. This may not be accurate but, in this case, it is better
         than failing the export
         """
-        model_data = build_supported_devices_map()
-        model_str = normalized_model(phone_model)
-        return deep_get(model_data, [model_str, "numberOfLineKeyButtons"], default=10)
+        return number_of_line_key_buttons(phone_model)
 
     def is_custom_layout(self):
-        if self.layout_resp.get("layoutMode") == "CUSTOM":
-            return True
-        return False
+        return self.layout_resp.get("layoutMode") == "CUSTOM"
 
     def expansion_module(self):
         return self.layout_resp.get("kemModuleType", "")
@@ -933,24 +1011,30 @@ class WbxcDeviceLayoutBuilder:
         Returns:
             List of WbxcDeviceLine instances
         """
+        # The layout and members requests are independent, so make them concurrently
+        self.layout_resp, self.members_resp = map_concurrently(
+            lambda get: get(resp["id"]), (self.get_layout_resp, self.get_members_resp)
+        )
+        self._build_positions_by_type(resp)
+        self._build_from_layout()
+        self._build_from_members()
+
+        return [model for _, model in sorted(self._models_by_pos.items())]
+
+    def get_layout_resp(self, device_id: str) -> dict:
         # fault will be raised for devices that don't support custom layout
         try:
-            self.layout_resp = self.client.device_layout.get(resp["id"])
+            return self.client.device_layout.get(device_id)
         except WbxcServerFault:
-            self.layout_resp = {}
+            return {}
 
+    def get_members_resp(self, device_id: str) -> dict:
         try:
-            self.members_resp = self.client.device_members.get(resp["id"])
+            return self.client.device_members.get(device_id)
         except WbxcServerFault as e:
             if "Group access device not found" in str(e):
-                self.members_resp = {}
-            else:
-                raise
-        self._build_positions_by_type(resp)
-        self._build_from_layout()
-        self._build_from_members()
-
-        return [self._models_by_pos[idx] for idx in sorted(self._models_by_pos)]
+                return {}
+            raise
 
     def get_position_for_type(self, line_type: str) -> int:
         """
@@ -962,10 +1046,10 @@ class WbxcDeviceLayoutBuilder:
         exception to be handled by the caller.
         """
         if self.positions_by_type.get(line_type):
-            return self.positions_by_type[line_type].pop(0)
+            return self.positions_by_type[line_type].popleft()
 
         if self.positions_by_type.get("OPEN"):
-            return self.positions_by_type["OPEN"].pop(0)
+            return self.positions_by_type["OPEN"].popleft()
 
         raise ValueError(f"Invalid idx request for {line_type} in layout {self.layout_resp}")
 
@@ -1016,11 +1100,17 @@ class WbxcDeviceLayoutBuilder:
         positions for all members assigned to the device. These won't appear on the
         device when registered, so excluding them from the export is accurate.
         """
-        members = sorted(self.members_resp.get("members", []), key=lambda m: m["port"])
+        members = sorted(self.members_resp.get("members", []), key=itemgetter("port"))
+        primary_line_type = get_model_line_type("PRIMARY_LINE")
+        shared_line_type = get_model_line_type("SHARED_LINE")
+
         for member in members:
 
             # Convert the member type to the layout type to look up the index
-            layout_type = "PRIMARY_LINE" if member["primaryOwner"] else "SHARED_LINE"
+            if member["primaryOwner"]:
+                layout_type, model_line_type = "PRIMARY_LINE", primary_line_type
+            else:
+                layout_type, model_line_type = "SHARED_LINE", shared_line_type
 
             for _ in range(0, member["lineWeight"]):
                 try:
@@ -1035,7 +1125,7 @@ class WbxcDeviceLayoutBuilder:
                     idx=idx,
                     number=number,
                     label=member.get("lineLabel", ""),
-                    type=get_model_line_type(layout_type),
+                    type=model_line_type,
                     allow_decline=member.get("allowCallDeclineEnabled", ""),
                     hotline_enabled=member.get("hotlineEnabled", ""),
                     hotline_destination=member.get("hotlineDestination", ""),
@@ -1055,16 +1145,13 @@ LINE_TYPE_MAP = [
 ]
 
 
+model_type_by_api_type = {api_type.lower(): model_type for model_type, api_type in LINE_TYPE_MAP}
+api_type_by_model_type = {model_type.lower(): api_type for model_type, api_type in LINE_TYPE_MAP}
+
+
 def get_model_line_type(api_line_type: str) -> str:
-    for model_type, api_type in LINE_TYPE_MAP:
-        if api_line_type.lower() == api_type.lower():
-            return model_type
-    return ""
+    return model_type_by_api_type.get(api_line_type.lower(), "")
 
 
 def get_api_line_type(model_line_type: str) -> str:
-    for model_type, api_type in LINE_TYPE_MAP:
-        if model_line_type.lower() == model_type.lower():
-            return api_type
-
-    return ""
+    return api_type_by_model_type.get(model_line_type.lower(), "")
@@ -5,13 +5,15 @@ from zeus.exceptions import ZeusBulkOpFailed
 from zeus.wbxc import wbxc_models as wm
 from zeus.shared import request_builder as rb
 from zeus.wbxc.wbxc_simple import WbxcSimpleClient
-from .supported_devices import build_supported_devices_map, normalized_model
+from .supported_devices import supported_devices_map, normalized_model, device_settings_models
 from zeus.services import ExportSvc, UploadTask, RowLoadResp
-from .shared import WbxcBulkSvc, WbxcLookup
+from .shared import WbxcBulkSvc, WbxcLookup, map_concurrently
 from ...shared.helpers import deep_get
 
 log = logging.getLogger(__name__)
 
+mcast_destination_col_rgx = re.compile(r"Enhanced Multicast\s(\d+)\sDestination", re.I)
+
 
 @reg.bulk_service("wbxc", "device_settings", "UPDATE")
 class WbxcDeviceSettingsUpdateSvc(WbxcBulkSvc):
@@ -39,7 +41,7 @@ class WbxcDeviceSettingsUpdateSvc(WbxcBulkSvc):
 
     def get_model_support_data(self):
         model_str = normalized_model(self.current["product"])
-        supported_devices = build_supported_devices_map()
+        supported_devices = supported_devices_map()
         if model_str in supported_devices:
             self.model_support_data = supported_devices[model_str]
             self.device_type = self.model_support_data.get("type", "").lower()
@@ -95,14 +97,12 @@ class WbxcDeviceSettingsUpdateSvc(WbxcBulkSvc):
             rb.ChangedField("mppUserWebAccessEnabled", "web_access"),
 
         ]
-        current = deep_get(self.current_settings, "customizations.mpp", default={})
-        builder = rb.RequestBuilder(
-            fields=fields,
-            data=self.model.to_payload(drop_unset=True),
-            current=current,
-        )
-        if builder.payload_is_changed():
-            mpp_payload = builder.payload()
+        data = self.model.to_payload(drop_unset=True)
+        if self.has_field_data(data, fields):
+            current = deep_get(self.current_settings, "customizations.mpp", default={})
+            builder = rb.RequestBuilder(fields=fields, data=data, current=current)
+            if builder.payload_is_changed():
+                mpp_payload = builder.payload()
 
         mpp_payload.update(self.build_enhanced_mcast_payload())
 
@@ -115,17 +115,25 @@ class WbxcDeviceSettingsUpdateSvc(WbxcBulkSvc):
             rb.ChangedField("webAccessEnabled", "web_access"),
 
         ]
+        data = self.model.to_payload(drop_unset=True)
+        if not self.has_field_data(data, fields):
+            return {}
+
         current = deep_get(self.current_settings, "customizations.ata", default={})
-        builder = rb.RequestBuilder(
-            fields=fields,
-            data=self.model.to_payload(drop_unset=True),
-            current=current,
-        )
+        builder = rb.RequestBuilder(fields=fields, data=data, current=current)
         if builder.payload_is_changed():
             return builder.payload()
 
         return {}
 
+    @staticmethod
+    def has_field_data(data: dict, fields: list[rb.RequestField]) -> bool:
+        """
+        Return True if the model data includes a value for any of the fields.
+        If not, no field can be changed and the RequestBuilder can be skipped.
+        """
+        return any(field.alias in data or field.name in data for field in fields)
+
     def build_enhanced_mcast_payload(self):
         """
         Create the 'enhancedMulticast' payload object based on the
@@ -152,7 +160,7 @@ class WbxcDeviceSettingsUpdateSvc(WbxcBulkSvc):
             for dest in self.model.enhanced_mcast_destinations:
                 entry = {
                     "hostAndPort": dest.destination,
-                    "hasXmlAppUrl": True if dest.xmlapp == "Y" else False
+                    "hasXmlAppUrl": dest.xmlapp == "Y"
                 }
                 if dest.timer:
                     entry["xmlAppTimeout"] = dest.timer
@@ -180,7 +188,7 @@ class WbxcDeviceSettingsUploadTask(UploadTask):
     def build_enhanced_multicast_destinations(row):
         destinations = []
         for key in row:
-            if m := re.search(r"Enhanced Multicast\s(\d+)\sDestination", key, re.I):
+            if m := mcast_destination_col_rgx.search(key):
 
                 if not row[key]:
                     continue
@@ -200,21 +208,29 @@ class WbxcDeviceSettingsUploadTask(UploadTask):
 @reg.export_service("wbxc", "device_settings")
 class WbxcDeviceSettingsExportTask(ExportSvc):
     def run(self):
-        rows = []
-        errors = []
         data_type = wm.WbxcDeviceSettings.schema()["data_type"]
         builder = WbxcDeviceSettingsModelBuilder(self.client)
 
         params = {"type": "phone"}
-        for resp in self.client.devices.list(**params):
+        # The settings API has no list/bulk variant, so a GET per device is required.
+        # Key the devices by ID to ensure the settings are only requested once per device.
+        devices = {
+            resp["id"]: resp for resp in self.client.devices.list(**params)
+            if builder.model_supports_settings(resp)
+        }
+
+        def build(resp):
+            try:
+                return builder.build_model(resp), None
+            except Exception as exc:
+                error = getattr(exc, "message", str(exc))
+                return None, {"name": self.error_row_name(resp), "error": error}
+
+        # The device settings GET for each device is independent, so make the requests concurrently.
+        results = map_concurrently(build, devices.values())
 
-            if builder.model_supports_settings(resp):
-                try:
-                    model = builder.build_model(resp)
-                    rows.append(model)
-                except Exception as exc:
-                    error = getattr(exc, "message", str(exc))
-                    errors.append({"name": self.error_row_name(resp), "error": error})
+        rows = [model for model, error in results if error is None]
+        errors = [error for _, error in results if error is not None]
 
         return {data_type: {"rows": rows, "errors": errors}}
 
@@ -236,24 +252,10 @@ class WbxcDeviceSettingsModelBuilder:
     def __init__(self, client):
         self.client: WbxcSimpleClient = client
         self.lookup = WbxcLookup(client)
-        self._device_settings_models: list = []
-
-    @property
-    def device_settings_models(self) -> dict:
-        """
-        Get phone models that support customizable device settings based
-        on the deviceSettingsConfiguration == WEBEX_CALLING_DEVICE_CONFIGURATION
-        in the supported devices response.
-        """
-        if not self._device_settings_models:
-            for model, details in build_supported_devices_map().items():
-                if details.get("deviceSettingsConfiguration") == "WEBEX_CALLING_DEVICE_CONFIGURATION":
-                    self._device_settings_models.append(model)
-        return self._device_settings_models
 
     def model_supports_settings(self, resp: dict) -> bool:
         model_str = normalized_model(resp["product"])
-        return model_str in self.device_settings_models
+        return model_str in device_settings_models()
 
     def build_model(self, dev: dict):
         resp = self.client.device_settings.get(dev["id"], deviceModel=dev["product"])
@@ -277,7 +279,7 @@ class WbxcDeviceSettingsModelBuilder:
 
     @staticmethod
     def build_enhanced_multicast(customizations):
-        mcast_url = deep_get(customizations, "enhancedMulticast.xmlAppUrl", default="")
+        mcast_url = (customizations.get("enhancedMulticast") or {}).get("xmlAppUrl", "")
         mcast_enabled = "Y" if mcast_url else "N"
 
         return {
@@ -288,7 +290,7 @@ class WbxcDeviceSettingsModelBuilder:
     @staticmethod
     def build_enhanced_multicast_destinations(customizations):
         destinations = []
-        mcast_list = deep_get(customizations, "enhancedMulticast.multicastList", default=[])
+        mcast_list = (customizations.get("enhancedMulticast") or {}).get("multicastList", [])
         for idx, item in enumerate(mcast_list, 1):
             dest = wm.WbxcDeviceEnhancedMultiCastDestination(
                 idx=idx,
@@ -1,17 +1,39 @@
 import re
 import logging
-from copy import deepcopy
+from functools import lru_cache
 from zeus import registry as reg
-from zeus.exceptions import ZeusBulkOpFailed
-from zeus.shared.helpers import deep_get
+from zeus.shared.helpers import deep_get, NODEFAULT
 from zeus.shared import request_builder as rb
-from .shared import WbxcBulkSvc, WbxcBulkTask, build_number_lookup_params
+from .shared import WbxcBulkSvc, WbxcBulkTask, map_concurrently
 from zeus.wbxc.wbxc_simple import WbxcSimpleClient
 from zeus.services import BrowseSvc, ExportSvc, DetailSvc, UploadTask, RowLoadResp
 from zeus.wbxc.wbxc_models.hunt_groups import PayloadAgent, PayloadAltNum, WbxcHuntGroup, WbxcHuntGroupAgent, WbxcHuntGroupAltNumber
 
 log = logging.getLogger(__name__)
 
+agent_col_rgx = re.compile(r"Agent\s*(\d+)")
+alt_number_col_rgx = re.compile(r"Alternate\s+Number\s*(\d+)")
+
+# WbxcHuntGroup fields that map to the callPolicies request object
+CALL_POLICY_MODEL_FIELDS = frozenset({
+    "hunt_policy",
+    "advance_when_busy",
+    "hunt_busy_enabled",
+    "hunt_busy_allow_users",
+    "advance_to_next_agent",
+    "advance_after_rings",
+    "forward_na_enabled",
+    "forward_na_rings",
+    "forward_na_destination",
+    "forward_na_vm",
+    "forward_busy_enabled",
+    "forward_busy_destination",
+    "forward_busy_vm",
+    "forward_ur_enabled",
+    "forward_ur_destination",
+    "forward_ur_vm",
+})
+
 
 def build_payload(
     model_data: dict,
@@ -19,6 +41,8 @@ def build_payload(
     agent_action: str,
     model_agents: list[PayloadAgent] | None,
 ):
+    # RequestFields hold the resolved values used by the builder's payload and rollback,
+    # so new instances are needed for each request rather than shared module-level lists.
     payload_fields = [
         rb.ChangedField("name"),
         rb.ChangedField("phoneNumber"),
@@ -85,6 +109,10 @@ def build_call_policy_payload(
         (RequestBuilder | None): RequestBuilder instance or None if the RequestBuilder includes no
          changes/values.
     """
+    if CALL_POLICY_MODEL_FIELDS.isdisjoint(model_data):
+        # No call policy values to send, so the payload would not include callPolicies
+        return None
+
     current_call_policy = current_call_policy or {}
 
     na_req = rb.RequestBuilder(
@@ -168,28 +196,34 @@ def build_agents_payload(
     if not agent_action or not model_agents:
         return []
 
-    def agents_by_id(agents):
-        return {agent["id"]: agent.get("weight", 0) for agent in agents}
+    current_by_id = {agent["id"]: agent.get("weight", 0) for agent in current_agents}
 
     if agent_action == "REPLACE":
         # Replace existing with provided
-        payload_by_id = agents_by_id(model_agents)
+        payload_by_id = {agent["id"]: agent.get("weight", 0) for agent in model_agents}
+        changed = payload_by_id != current_by_id
 
     elif agent_action == "REMOVE":
         # Remove provided agents from existing, if present
-        payload_by_id = agents_by_id(current_agents)
+        payload_by_id = current_by_id.copy()
+        changed = False
         for entry in model_agents:
-            payload_by_id.pop(entry["id"], None)
+            if entry["id"] in payload_by_id:
+                del payload_by_id[entry["id"]]
+                changed = True
 
     else:
         # ADD action
         # append agents to current agents, ensuring no duplicates
-        payload_by_id = agents_by_id(current_agents)
+        payload_by_id = current_by_id.copy()
+        changed = False
         for entry in model_agents:
-            if payload_by_id.get(entry["id"]) != entry["weight"]:
-                payload_by_id[entry["id"]] = entry["weight"]
+            agent_id, weight = entry["id"], entry["weight"]
+            if payload_by_id.get(agent_id, NODEFAULT) != weight:
+                payload_by_id[agent_id] = weight
+                changed = True
 
-    if payload_by_id == agents_by_id(current_agents):
+    if not changed:
         # If no change, return empty list so ValuedField will be excluded from payload
         return []
 
@@ -204,21 +238,30 @@ def build_alternate_numbers_for_payload(
         item["phoneNumber"]: item.get("ringPattern", "NORMAL")
         for item in current_alt_number_settings.get("alternateNumbers") or []
     }
-    payload_alt_numbers = deepcopy(current_alt_numbers)
+
+    model_alt_numbers = [(altnum.phoneNumber, altnum.ringPattern) for altnum in model.alternate_numbers]
 
     if model.alternate_number_action == "REPLACE":
-        payload_alt_numbers = {altnum.phoneNumber: altnum.ringPattern for altnum in model.alternate_numbers}
+        payload_alt_numbers = dict(model_alt_numbers)
+        changed = payload_alt_numbers != current_alt_numbers
 
     elif model.alternate_number_action == "REMOVE":
-        for item in model.alternate_numbers:
-            payload_alt_numbers.pop(item.phoneNumber, None)
+        payload_alt_numbers = current_alt_numbers.copy()
+        changed = False
+        for number, _ in model_alt_numbers:
+            if number in payload_alt_numbers:
+                del payload_alt_numbers[number]
+                changed = True
 
     else:
-        for altnum in model.alternate_numbers:
-            if payload_alt_numbers.get(altnum.phoneNumber) != altnum.ringPattern:
-                payload_alt_numbers[altnum.phoneNumber] = altnum.ringPattern
-
-    if payload_alt_numbers == current_alt_numbers:
+        payload_alt_numbers = current_alt_numbers.copy()
+        changed = False
+        for number, pattern in model_alt_numbers:
+            if payload_alt_numbers.get(number, NODEFAULT) != pattern:
+                payload_alt_numbers[number] = pattern
+                changed = True
+
+    if not changed:
         return []
 
     return [
@@ -243,21 +286,14 @@ class WbxcHuntGroupCreateSvc(WbxcBulkSvc):
         self.add_alternate_numbers()
 
     def get_agents_to_add(self):
-        for agent in self.model.agents:
-            number = self.lookup_agent_number(agent.number)
+        agents = self.model.agents
+        numbers = self.lookup.numbers_by_any(agent.number for agent in agents)
+        for agent in agents:
+            number = numbers[agent.number]
             self.payload_agents.append(
                 {"id": number["owner"]["id"], "weight": agent.weight}
             )
 
-    def lookup_agent_number(self, number):
-        for params in build_number_lookup_params(number):
-            try:
-                return self.lookup.number(**params)
-            except ZeusBulkOpFailed:
-                continue
-
-        raise ZeusBulkOpFailed(f"Number: {number} not found")
-
     def create_hunt_group(self):
         model_data = self.model.to_payload(exclude={"agents"}, drop_unset=True)
         builder = build_payload(
@@ -299,26 +335,22 @@ class WbxcHuntGroupUpdateSvc(WbxcBulkSvc):
         """
         Save location ID and name from LIST response into
         self.location for use by the update tasks
+
+        The LIST response does not include the agents, call policies or
+        alternate number settings, so the GET is required. This single GET
+        response is used by both the hunt group and alternate number updates.
         """
         resp = self.lookup.hunt_group(self.model.name)
         self.location = {"id": resp["locationId"], "locationName": resp["locationName"]}
         self.current = self.client.huntgroups.get(resp["locationId"], resp["id"])
 
     def get_agents_for_update(self):
-        for agent in self.model.agents:
-            params = build_number_lookup_params(agent.number)
-            number = self.lookup_agent_number(agent.number)
-            agent_id = number["owner"]["id"]
+        agents = self.model.agents
+        numbers = self.lookup.numbers_by_any(agent.number for agent in agents)
+        for agent in agents:
+            agent_id = numbers[agent.number]["owner"]["id"]
             self.payload_agents.append({"id": agent_id, "weight": agent.weight})
 
-    def lookup_agent_number(self, number):
-        for params in build_number_lookup_params(number):
-            try:
-                return self.lookup.number(**params)
-            except ZeusBulkOpFailed:
-                continue
-
-        raise ZeusBulkOpFailed(f"Number: {number} not found")
     def update_hunt_group(self):
         task = WbxcHuntGroupUpdateTask(self)
         task.run()
@@ -428,66 +460,90 @@ class WbxcHuntGroupDeleteSvc(WbxcBulkSvc):
 class WbxcHuntGroupUploadTask(UploadTask):
 
     def validate_row(self, idx: int, row: dict):
+        agents = []
+        alternate_numbers = []
         try:
-            row["agents"] = self.build_agents(row)
-            row["alternate_numbers"] = self.build_alternate_numbers(row)
+            for col_header, value in row.items():
+                col_type, col_idx = upload_col_type(col_header)
+
+                if col_type == "agent":
+                    if agent := self.build_agent(col_idx, value):
+                        agents.append(agent)
+
+                elif col_type == "altnum":
+                    if altnum := self.build_alternate_number(col_idx, value):
+                        alternate_numbers.append(altnum)
+
         except Exception as exc:
             return RowLoadResp(index=idx, error=str(exc))
 
+        row["agents"] = agents
+        row["alternate_numbers"] = alternate_numbers
+
         return super().validate_row(idx, row)
 
     @staticmethod
-    def build_agents(row):
-        agents = []
-        for col_header, value in row.items():
-            if m := re.search(r"Agent\s*(\d+)", col_header):
-                idx = m.group(1)
-
-                if "=" in value:
-                    number, weight_str = re.split(r"\s*=\s*", value)
-                    try:
-                        weight = int(weight_str)
-                    except Exception:
-                        raise ValueError(f"Weight: '{weight_str}' is invalid")
-                else:
-                    number, weight = value, 0
-
-                if number:
-                    agents.append(dict(idx=idx, number=number, weight=weight))
+    def build_agent(idx: str, value: str) -> dict | None:
+        if "=" in value:
+            number, _, weight_str = value.partition("=")
+            number, weight_str = number.strip(), weight_str.strip()
+            try:
+                weight = int(weight_str)
+            except Exception:
+                raise ValueError(f"Weight: '{weight_str}' is invalid")
+        else:
+            number, weight = value, 0
 
-        return agents
+        if number:
+            return dict(idx=idx, number=number, weight=weight)
+
+        return None
 
     @staticmethod
-    def build_alternate_numbers(row):
-        altnums = []
-        for col_header, value in row.items():
-            if m := re.search(r"Alternate\s+Number\s*(\d+)", col_header):
-                idx = m.group(1)
+    def build_alternate_number(idx: str, value: str) -> dict | None:
+        if "=" in value:
+            number, _, pattern = value.partition("=")
+            number, pattern = number.strip(), pattern.strip()
+        else:
+            number, pattern = value, "REGULAR"
+
+        if number:
+            return dict(idx=idx, phoneNumber=number, ringPattern=pattern)
+
+        return None
 
-                if "=" in value:
-                    number, pattern = re.split(r"\s*=\s*", value)
-                else:
-                    number, pattern = value, "REGULAR"
 
-                if number:
-                    altnums.append(dict(idx=idx, phoneNumber=number, ringPattern=pattern))
+@lru_cache(maxsize=1024)
+def upload_col_type(col_header: str) -> tuple[str, str] | tuple[None, None]:
+    """
+    Return ("agent", idx) or ("altnum", idx) if the worksheet column header
+    is an agent or alternate number column. Otherwise, return (None, None).
+
+    Cached as every row of an upload has the same column headers.
+    """
+    if m := agent_col_rgx.search(col_header):
+        return "agent", m.group(1)
 
-        return altnums
+    if m := alt_number_col_rgx.search(col_header):
+        return "altnum", m.group(1)
+
+    return None, None
 
 
 @reg.browse_service("wbxc", "hunt_groups")
 class WbxcHuntGroupBrowseSvc(BrowseSvc):
-    def run(self):
-        rows = []
+    # Only these fields are populated by `build_model` and shown in the browse table
+    browse_fields = frozenset({"name", "location_name", "extension", "phoneNumber"})
 
-        for resp in self.client.huntgroups.list():
-            model = self.build_model(resp)
-            row = model.dict()
-            row["detail_id"] = resp["id"]
-            row["location_id"] = resp["locationId"]
-            rows.append(row)
-
-        return rows
+    def run(self):
+        return [
+            {
+                **self.build_model(resp).dict(include=self.browse_fields),
+                "detail_id": resp["id"],
+                "location_id": resp["locationId"],
+            }
+            for resp in self.client.huntgroups.list()
+        ]
 
     @staticmethod
     def build_model(resp):
@@ -525,13 +581,19 @@ class WbxcHuntGroupExportSvc(ExportSvc):
         data_type = WbxcHuntGroup.schema()["data_type"]
         builder = WbxcHuntGroupModelBuilder()
 
-        for item in self.client.huntgroups.list():
+        def build(item):
             try:
                 resp = self.client.huntgroups.get(item["locationId"], item["id"])
-                model = builder.build_model(resp, item["locationName"])
-                rows.append(model)
+                return builder.build_model(resp, item["locationName"]), None
             except Exception as exc:
-                error = getattr(exc, "message", str(exc))
+                return None, getattr(exc, "message", str(exc))
+
+        # The GET for each hunt group is independent, so make the requests concurrently
+        items = list(self.client.huntgroups.list())
+        for item, (model, error) in zip(items, map_concurrently(build, items)):
+            if error is None:
+                rows.append(model)
+            else:
                 errors.append({"name": item.get("name", "unknown"), "error": error})
 
         return {data_type: {"rows": rows, "errors": errors}}
@@ -539,17 +601,14 @@ class WbxcHuntGroupExportSvc(ExportSvc):
 
 class WbxcHuntGroupModelBuilder:
     def build_model(self, resp, location_name):
-        hunt_busy_enabled = deep_get(
-            resp, "callPolicies.groupBusyEnabled", default="UNKNOWN"
-        )
-        hunt_policy = deep_get(resp, "callPolicies.policy", default="UNKNOWN")
-        hunt_busy_allow_users = deep_get(
-            resp, "callPolicies.allowMembersToControlGroupBusyEnabled", default="UNKNOWN"
-        )
-        advance_when_busy = deep_get(resp, "callPolicies.waitingEnabled", default="UNKNOWN")
-        distinctiveRing = deep_get(
-            resp, "alternateNumberSettings.distinctiveRingEnabled", default=""
-        )
+        call_policies = resp.get("callPolicies") or {}
+        alt_number_settings = resp.get("alternateNumberSettings") or {}
+
+        hunt_busy_enabled = call_policies.get("groupBusyEnabled", "UNKNOWN")
+        hunt_policy = call_policies.get("policy", "UNKNOWN")
+        hunt_busy_allow_users = call_policies.get("allowMembersToControlGroupBusyEnabled", "UNKNOWN")
+        advance_when_busy = call_policies.get("waitingEnabled", "UNKNOWN")
+        distinctiveRing = alt_number_settings.get("distinctiveRingEnabled", "")
 
         return WbxcHuntGroup.safe_build(
             name=resp["name"],
@@ -567,20 +626,17 @@ class WbxcHuntGroupModelBuilder:
             hunt_busy_allow_users=hunt_busy_allow_users,
             advance_when_busy=advance_when_busy,
             agents=self.build_agents(resp),
-            alternate_numbers=self.build_alternate_numbers(resp),
-            **self.build_forward_na(resp),
-            **self.build_forward_busy(resp),
-            **self.build_forward_unreachable(resp),
+            alternate_numbers=self.build_alternate_numbers(alt_number_settings),
+            **self.build_forward_na(call_policies),
+            **self.build_forward_busy(call_policies),
+            **self.build_forward_unreachable(call_policies),
         )
 
     @staticmethod
-    def build_agents(resp) -> list:
-        agents = []
+    def build_agents(resp) -> list[WbxcHuntGroupAgent]:
         agent_resp = resp.get("agents") or []
-        agent_numbers_with_optional_weights = []
-
-        for idx, item in enumerate(agent_resp, 1):
-            agent = WbxcHuntGroupAgent(
+        agents = [
+            WbxcHuntGroupAgent(
                 idx=idx,
                 phoneNumber=item.get("phoneNumber", ""),
                 extension=item.get("extension", ""),
@@ -589,15 +645,14 @@ class WbxcHuntGroupModelBuilder:
                 weight=item.get("weight", 0),
                 type=item.get("type", ""),
             )
-            agents.append(agent)
+            for idx, item in enumerate(agent_resp, 1)
+        ]
 
         return agents
 
     @staticmethod
-    def build_alternate_numbers(resp) -> list[WbxcHuntGroupAltNumber]:
-        alternate_numbers_resp = deep_get(
-            resp, "alternateNumberSettings.alternateNumbers", default=[]
-        )
+    def build_alternate_numbers(alt_number_settings: dict) -> list[WbxcHuntGroupAltNumber]:
+        alternate_numbers_resp = alt_number_settings.get("alternateNumbers") or []
         alternate_numbers = [
             WbxcHuntGroupAltNumber(
                 idx=idx,
@@ -610,8 +665,8 @@ class WbxcHuntGroupModelBuilder:
         return alternate_numbers
 
     @staticmethod
-    def build_forward_busy(resp) -> dict:
-        fwd_resp = deep_get(resp, "callPolicies.busyRedirect", default={})
+    def build_forward_busy(call_policies: dict) -> dict:
+        fwd_resp = call_policies.get("busyRedirect") or {}
 
         return {
             "forward_busy_enabled": fwd_resp.get("enabled", ""),
@@ -620,8 +675,8 @@ class WbxcHuntGroupModelBuilder:
         }
 
     @staticmethod
-    def build_forward_unreachable(resp) -> dict:
-        fwd_resp = deep_get(resp, "callPolicies.businessContinuityRedirect", default={})
+    def build_forward_unreachable(call_policies: dict) -> dict:
+        fwd_resp = call_policies.get("businessContinuityRedirect") or {}
 
         return {
             "forward_ur_enabled": fwd_resp.get("enabled", ""),
@@ -630,8 +685,8 @@ class WbxcHuntGroupModelBuilder:
         }
 
     @staticmethod
-    def build_forward_na(resp) -> dict:
-        fwd_resp = deep_get(resp, "callPolicies.noAnswer", default={})
+    def build_forward_na(call_policies: dict) -> dict:
+        fwd_resp = call_policies.get("noAnswer") or {}
 
         return {
             "forward_na_enabled": fwd_resp.get("forwardEnabled"),
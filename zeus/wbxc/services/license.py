@@ -1,5 +1,6 @@
 import re
 import logging
+from functools import cached_property
 from zeus import registry as reg
 from zeus.wbxc.wbxc_models import WbxcLicense
 from .shared import WbxcBulkSvc, WbxcBulkTask
@@ -8,19 +9,25 @@ from zeus.wbxc.wbxc_models.shared import WEBEX_CALLING_LICENSE_TYPES
 
 log = logging.getLogger(__name__)
 
+calling_license_col_rgx = re.compile(r"Calling License\s*(\d+)")
+
 
 @reg.bulk_service("wbxc", "licenses", "UPDATE")
 class WbxcLicenseSvc(WbxcBulkSvc):
     """Assign/unassign Webex Calling-related licenses to Webex users."""
+    __slots__ = ("current_user", "assigned_license_ids", "model_licenses_by_name", "calling_license_ids")
 
     def __init__(self, client, model, **kwargs):
         super().__init__(client, model, **kwargs)
         self.model: WbxcLicense = model
         self.current_user: dict = {}
+        self.assigned_license_ids: frozenset[str] = frozenset()
         self.model_licenses_by_name: dict[str, str] = {}
+        self.calling_license_ids: set[str] = set()
 
     def run(self):
         self.current_user = self.lookup.user(name=self.model.user_email, calling_data=True)
+        self.assigned_license_ids = frozenset(self.current_user.get("licenses", []))
         self.lookup_licenses()
         task = WbxcUpdateLicenseTask(self)
         task.run()
@@ -29,18 +36,30 @@ class WbxcLicenseSvc(WbxcBulkSvc):
     def lookup_licenses(self):
         """
         Lookup the license names in the model and save them to a dictionary
-        keyed by the returned license id
+        keyed by the returned license id.
+
+        The ids of Webex Calling licenses are also saved so the update and
+        rollback payload builders can identify them without a reverse lookup
         """
+        license_ids = {}
         for entry in self.model.licenses:
-            resp = self.lookup.license(entry.license, entry.subscription)
-            self.model_licenses_by_name[entry.license] = resp["id"]
+            key = (entry.license, entry.subscription)
+            if key not in license_ids:
+                license_ids[key] = self.lookup.license(entry.license, entry.subscription)["id"]
+
+            self.model_licenses_by_name[entry.license] = license_ids[key]
+            if entry.license in WEBEX_CALLING_LICENSE_TYPES:
+                self.calling_license_ids.add(license_ids[key])
 
 
 class WbxcUpdateLicenseTask(WbxcBulkTask):
+    __slots__ = ("update_payload", "_calling_license_properties")
+
     def __init__(self, svc, **kwargs):
         super().__init__(svc, **kwargs)
         self.svc: WbxcLicenseSvc = svc
         self.update_payload: dict = {}
+        self._calling_license_properties: dict | None = None
 
     def run(self):
         self.build_update_payload()
@@ -56,15 +75,26 @@ class WbxcUpdateLicenseTask(WbxcBulkTask):
         inclusion will result in a change. A license will not be
         added if it already is assigned to the user and a license will
         not be removed if it is not currently assigned to the user=
+
+        If every license is already in the requested state, the payload
+        is left empty without building any entries.
         """
+        license_id_by_name = self.svc.model_licenses_by_name.__getitem__
+        assigned = self.svc.assigned_license_ids
+        add_ids = {license_id_by_name(lic.license) for lic in self.model.licenses if lic.operation == "add"}
+        remove_ids = {license_id_by_name(lic.license) for lic in self.model.licenses if lic.operation != "add"}
+        if add_ids <= assigned and remove_ids.isdisjoint(assigned):
+            self.update_payload = {}
+            return
+
         payload_licenses = []
         for model_lic in self.model.licenses:
             if self.should_include_license(model_lic):
                 entry = {
                     "operation": model_lic.operation,
-                    "id": self.svc.model_licenses_by_name[model_lic.license],
+                    "id": license_id_by_name(model_lic.license),
                 }
-                if model_lic.license in WEBEX_CALLING_LICENSE_TYPES and model_lic.operation == "add":
+                if entry["id"] in self.svc.calling_license_ids and model_lic.operation == "add":
                     entry["properties"] = self.build_webex_calling_license_properties()
 
                 payload_licenses.append(entry)
@@ -80,7 +110,7 @@ class WbxcUpdateLicenseTask(WbxcBulkTask):
     def should_include_license(self, model_lic) -> bool:
         is_add_op = model_lic.operation == "add"
         license_id = self.svc.model_licenses_by_name[model_lic.license]
-        is_already_assigned = license_id in self.svc.current_user.get("licenses", [])
+        is_already_assigned = license_id in self.svc.assigned_license_ids
 
         if is_add_op:
             should_include = not is_already_assigned
@@ -101,8 +131,17 @@ class WbxcUpdateLicenseTask(WbxcBulkTask):
         - extension and locationId if extension is set in the model but calling_phone_number is not
 
         It is assumed model validation ensures one of these can be met
+
+        The properties are the same for the update and rollback payloads,
+        so they are only built once.
         """
+        if self._calling_license_properties is not None:
+            return self._calling_license_properties
+
         properties = {}
+        if not self.model.calling_phone_number and not self.model.calling_extension:
+            self._calling_license_properties = properties
+            return properties
 
         if self.model.calling_phone_number:
             properties["phoneNumber"] = self.model.calling_phone_number
@@ -115,6 +154,7 @@ class WbxcUpdateLicenseTask(WbxcBulkTask):
                 self.model.calling_location
             )["id"]
 
+        self._calling_license_properties = properties
         return properties
 
     def build_rollback_payload(self) -> dict:
@@ -124,12 +164,10 @@ class WbxcUpdateLicenseTask(WbxcBulkTask):
         properties are included if a calling license is being re-added
         """
         rollback_licenses = []
-        licenses_by_id = {v: k for k, v in self.svc.model_licenses_by_name.items()}
         for payload_lic in self.update_payload.get("licenses", []):
             op = "add" if payload_lic["operation"] == "remove" else "remove"
             rollback_lic = {"id": payload_lic["id"], "operation": op}
-            lic_name = licenses_by_id[payload_lic["id"]]
-            if lic_name in WEBEX_CALLING_LICENSE_TYPES and op == "add":
+            if payload_lic["id"] in self.svc.calling_license_ids and op == "add":
                 rollback_lic["properties"] = self.build_webex_calling_license_properties()
 
             rollback_licenses.append(rollback_lic)
@@ -166,8 +204,25 @@ class WbxcLicenseUploadTask(UploadTask):
 
         return super().validate_row(idx, row)
 
-    @staticmethod
-    def build_licenses(row):
+    @cached_property
+    def license_columns(self) -> list[tuple[str, str, str, str]]:
+        """
+        Find the "Calling License {index}" columns in the worksheet headers and
+        return an (index, license column, subscription column, operation column)
+        tuple for each.
+
+        All rows loaded from a worksheet share the same headers, so the columns
+        are found once from the first row rather than searched for in every row.
+        """
+        columns = []
+        for col_header in self.rows[0] if self.rows else []:
+            if m := calling_license_col_rgx.search(col_header):
+                idx = m.group(1)
+                columns.append((idx, col_header, f"Subscription {idx}", f"Operation {idx}"))
+
+        return columns
+
+    def build_licenses(self, row):
         """
         Builds a list of licenses from a provided row. Extracts
         relevant license information based on specific column headers containing
@@ -184,27 +239,23 @@ class WbxcLicenseUploadTask(UploadTask):
             (license index), `license` (license type), and `operation` (operation to perform (add/remove)).
         """
         licenses = []
-        for col_header, value in row.items():
-            if m := re.search(r"Calling License\s*(\d+)", col_header):
-                idx = m.group(1)
-                if value:
-                    try:
-                        subscription = row[f"Subscription {idx}"]
-                    except KeyError:
-                        subscription = ""
-
-                    try:
-                        operation = row[f"Operation {idx}"]
-                    except KeyError:
-                        raise ValueError(f"Operation {idx}: column not found")
-
-                    licenses.append(
-                        dict(
-                            idx=idx,
-                            license=value,
-                            subscription=subscription,
-                            operation=operation,
-                        )
+        for idx, license_col, subscription_col, operation_col in self.license_columns:
+            value = row.get(license_col)
+            if value:
+                subscription = row.get(subscription_col, "")
+
+                try:
+                    operation = row[operation_col]
+                except KeyError:
+                    raise ValueError(f"Operation {idx}: column not found")
+
+                licenses.append(
+                    dict(
+                        idx=idx,
+                        license=value,
+                        subscription=subscription,
+                        operation=operation,
                     )
+                )
 
         return licenses
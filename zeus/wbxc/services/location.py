@@ -1,13 +1,16 @@
 import logging
 from zeus import registry as reg
-from zeus.shared.helpers import deep_get
 from zeus.services import BrowseSvc, ExportSvc, DetailSvc
 from zeus.wbxc.wbxc_models import WbxcLocation, WbxcLocationCalling
 from zeus.wbxc.wbxc_simple import WbxcSimpleClient
-from .shared import WbxcBulkSvc, WbxcBulkTask, WbxcLookup, parse_call_permissions
+from .shared import WbxcBulkSvc, WbxcBulkTask, WbxcLookup, parse_call_permissions, map_concurrently
 
 log = logging.getLogger(__name__)
 
+ADDRESS_FIELDS = frozenset({"address1", "address2", "city", "state", "country", "postalCode"})
+UPDATE_FIELDS = frozenset({"timeZone", "preferredLanguage", "latitude", "longitude", "notes"})
+SUMMARY_FIELDS = ("timeZone", "preferredLanguage", "latitude", "longitude", "notes")
+
 
 def build_address_payload(model: WbxcLocation, drop_unset=False) -> dict:
     """
@@ -15,9 +18,15 @@ def build_address_payload(model: WbxcLocation, drop_unset=False) -> dict:
     Ensure all address attributes are included-using model values where they differ
     from the existing values.
     """
-    includes = {"address1", "address2", "city", "state", "country", "postalCode"}
-    payload = model.to_payload(include=includes, drop_unset=drop_unset)
-    if payload.get("address2", "").lower() == "remove":
+    payload = model.to_payload(include=ADDRESS_FIELDS, drop_unset=drop_unset)
+    return normalize_address2(payload)
+
+
+def normalize_address2(payload: dict) -> dict:
+    """Replace an address2 value of 'remove' with an empty string to clear it."""
+    # Check the length first so most values are not lowercased
+    address2 = payload.get("address2")
+    if address2 and len(address2) == 6 and address2.lower() == "remove":
         payload["address2"] = ""
     return payload
 
@@ -43,6 +52,7 @@ class WbxcLocationCreateSvc(WbxcBulkSvc):
 
 @reg.bulk_service("wbxc", "locations", "UPDATE")
 class WbxcLocationUpdateSvc(WbxcBulkSvc):
+    __slots__ = ()
 
     def __init__(self, client, model, **kwargs):
         super().__init__(client, model, **kwargs)
@@ -55,13 +65,16 @@ class WbxcLocationUpdateSvc(WbxcBulkSvc):
 
 
 class WbxcLocationUpdateTask(WbxcBulkTask):
+    __slots__ = ("update_payload",)
+
     def __init__(self, svc, **kwargs):
         super().__init__(svc, **kwargs)
         self.update_payload: dict = {}
 
     def run(self):
         self.build_payload()
-        self.client.locations.update(self.svc.current["id"], payload=self.update_payload)
+        if self.update_payload:
+            self.client.locations.update(self.svc.current["id"], payload=self.update_payload)
 
     def build_payload(self):
         """
@@ -69,21 +82,27 @@ class WbxcLocationUpdateTask(WbxcBulkTask):
 
         NOTE: name, preferredLanguage and address are required on any UPDATE even though
         the documentation states it's not. Adding them here to the payload if there are any changes.
+
+        If every payload value matches the current value, the payload is left empty
+        so no request is sent.
         """
         current_lang = self.svc.current.get("preferredLanguage", "")
-        address = self.svc.current["address"].copy()
-        address.update(build_address_payload(self.model, drop_unset=True))
+        model_payload = self.model.to_payload(include=ADDRESS_FIELDS | UPDATE_FIELDS, drop_unset=True)
+        model_address = normalize_address2(
+            {key: model_payload.pop(key) for key in ADDRESS_FIELDS if key in model_payload}
+        )
+
+        current_address = self.svc.current["address"]
+        address = {**current_address, **model_address} if model_address else current_address
         payload = {
             "address": address,
             "preferredLanguage": current_lang,
             "name": self.model.new_name or self.model.name,
         }
-
-        includes = {"timeZone", "preferredLanguage", "latitude", "longitude", "notes"}
-        model_payload = self.model.to_payload(include=includes, drop_unset=True)
         payload.update(model_payload)
 
-        self.update_payload = payload
+        if any(value != self.svc.current.get(key) for key, value in payload.items()):
+            self.update_payload = payload
 
     def rollback(self):
         if self.update_payload:
@@ -127,12 +146,18 @@ class WbxcLocationExportSvc(ExportSvc):
         data_type = WbxcLocation.schema()["data_type"]
         builder = WbxcLocationModelBuilder(self.client)
 
-        for resp in self.client.locations.list():
+        def build(resp):
             try:
-                model = builder.build_export_model(resp)
-                rows.append(model)
+                return builder.build_export_model(resp), None
             except Exception as exc:
-                error = getattr(exc, "message", str(exc))
+                return None, getattr(exc, "message", str(exc))
+
+        # The calling enabled check for each location is independent, so make the requests concurrently
+        locations = list(self.client.locations.list())
+        for resp, (model, error) in zip(locations, map_concurrently(build, locations)):
+            if error is None:
+                rows.append(model)
+            else:
                 errors.append({"name": resp.get("name", "unknown"), "error": error})
 
         return {data_type: {"rows": rows, "errors": errors}}
@@ -164,18 +189,11 @@ class WbxcLocationModelBuilder:
 
     @staticmethod
     def summary_data(resp: dict) -> dict:
-        address = resp.get("address") or {}
-
-        return dict(
-            name=resp["name"],
-            timeZone=resp.get("timeZone", ""),
-            preferredLanguage=resp.get("preferredLanguage", ""),
-            latitude=resp.get("latitude", ""),
-            longitude=resp.get("longitude", ""),
-            notes=resp.get("notes", ""),
-            # calling_enabled=calling_enabled,
-            **address
-        )
+        return {
+            "name": resp["name"],
+            **{key: resp.get(key, "") for key in SUMMARY_FIELDS},
+            **(resp.get("address") or {}),
+        }
 
 
 class WbxcLocationCallingModelBuilder:
@@ -184,9 +202,9 @@ class WbxcLocationCallingModelBuilder:
     Only calling-enabled locations are included
     """
 
-    def __init__(self, client):
+    def __init__(self, client, lookup: WbxcLookup | None = None):
         self.client: WbxcSimpleClient = client
-        self.lookup = WbxcLookup(client)
+        self.lookup = lookup or WbxcLookup(client)
 
     def build_model(self, resp: dict):
         calling_enabled = self.lookup.is_calling_enabled_for_location(resp["id"])
@@ -194,28 +212,25 @@ class WbxcLocationCallingModelBuilder:
             return None
 
         identifier = resp["id"]
-        calling_settings = self.get_calling_settings(identifier)
-        internal_dialing = self.get_internal_dialing(identifier)
-        voicemail = self.get_voicemail(identifier)
-        voiceportal = self.get_voiceportal(identifier)
-        outgoing_permissions = self.get_outgoing_permissions(identifier)
-        outgoing_auto_transfer = self.get_outgoing_auto_transfer(identifier)
-        music_on_hold = self.get_music_on_hold(identifier)
-
-        return WbxcLocationCalling.safe_build(
-            name=resp["name"],
-            **calling_settings,
-            **internal_dialing,
-            **voicemail,
-            **voiceportal,
-            **outgoing_permissions,
-            **outgoing_auto_transfer,
-            **music_on_hold,
+        getters = (
+            self.get_calling_settings,
+            self.get_internal_dialing,
+            self.get_voicemail,
+            self.get_voiceportal,
+            self.get_outgoing_permissions,
+            self.get_outgoing_auto_transfer,
+            self.get_music_on_hold,
         )
+        # Each settings GET is independent, so make the requests concurrently
+        settings = map_concurrently(lambda get: get(identifier), getters)
+        model_data = {key: value for section in settings for key, value in section.items()}
+
+        return WbxcLocationCalling.safe_build(name=resp["name"], **model_data)
 
     def get_calling_settings(self, identifier):
         resp = self.client.location_call_settings.get(identifier)
-        connection_id = deep_get(resp, "connection.id", default="")
+        connection = resp.get("connection") or {}
+        connection_id = connection.get("id", "")
         connection_name = (
             self.lookup.routing_choice(connection_id) if connection_id else {}
         )
@@ -226,8 +241,8 @@ class WbxcLocationCallingModelBuilder:
             "enforceOutsideDialDigit": resp.get("enforceOutsideDialDigit", ""),
             "externalCallerIdName": resp.get("externalCallerIdName", ""),
             "announcementLanguage": resp.get("announcementLanguage", ""),
-            "callingLineIdPhoneNumber": deep_get(resp, "callingLineId.phoneNumber", ""),
-            "connectionType": deep_get(resp, "connection.type", ""),
+            "callingLineIdPhoneNumber": (resp.get("callingLineId") or {}).get("phoneNumber", ""),
+            "connectionType": connection.get("type", ""),
             "connectionName": connection_name.get("name", ""),
         }
 
@@ -235,8 +250,8 @@ class WbxcLocationCallingModelBuilder:
         resp = self.client.location_internal_dialing.get(identifier)
         return {
             "enableUnknownExtensionRoutePolicy": resp["enableUnknownExtensionRoutePolicy"],
-            "unknownExtensionRouteName": deep_get(
-                resp, "unknownExtensionRouteIdentity.name", default=""
+            "unknownExtensionRouteName": (
+                (resp.get("unknownExtensionRouteIdentity") or {}).get("name", "")
             ),
         }
 
@@ -263,10 +278,11 @@ class WbxcLocationCallingModelBuilder:
 
     def get_music_on_hold(self, identifier):
         resp = self.client.location_music_on_hold.get(identifier)
+        audio_file = resp.get("audioFile") or {}
         return {
             "callHoldEnabled": resp.get("callHoldEnabled", ""),
             "callParkEnabled": resp.get("callParkEnabled", ""),
             "greeting": resp.get("greeting", ""),
-            "fileName": deep_get(resp, "audioFile.fileName", default=""),
-            "level": deep_get(resp, "audioFile.level", default=""),
+            "fileName": audio_file.get("fileName", ""),
+            "level": audio_file.get("level", ""),
         }
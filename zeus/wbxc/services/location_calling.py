@@ -1,10 +1,14 @@
 import logging
+from threading import Lock
 from .shared import (
     WbxcBulkSvc,
     WbxcBulkTask,
     WbxcLookup,
     remove_to_none,
     parse_call_permissions,
+    map_concurrently,
+    run_concurrently,
+    prefetch,
 )
 from zeus.wbxc.services import shared_calling_tasks as sh
 from copy import deepcopy
@@ -29,6 +33,10 @@ class WbxcLocationCallingSvc(WbxcBulkSvc):
 
     The Location will first be enabled for calling (if not already
     enabled) before the tasks to apply settings are run.
+
+    The settings lookups and most of the update tasks use separate
+    endpoints, so they are run concurrently. The connection route and
+    call settings tasks use the same endpoint and are run in sequence.
     """
 
     def __init__(self, client, model, **kwargs):
@@ -39,24 +47,32 @@ class WbxcLocationCallingSvc(WbxcBulkSvc):
         self.music_on_hold_announcement: dict = {}
         self.connection_route: dict = {}
         self.internal_dialing_route: dict = {}
+        self._rollback_lock = Lock()
 
     def run(self):
         self.get_current()
         self.enable_calling_for_location()
 
-        self.get_connection_route()
-        self.get_call_settings()
-        self.get_internal_dialing()
-        self.get_music_on_hold_announcement()
+        run_concurrently(
+            self.get_connection_route,
+            self.get_call_settings,
+            self.get_internal_dialing,
+            self.get_music_on_hold_announcement,
+        )
 
-        self.update_connection_route()
-        self.update_call_settings()
-        self.update_internal_dialing()
-        self.update_voicemail()
-        self.update_voice_portal()
-        self.update_outgoing_permission()
-        self.update_outgoing_auto_transfer()
-        self.update_music_on_hold()
+        run_concurrently(
+            self.update_connection_route_and_call_settings,
+            self.update_internal_dialing,
+            self.update_voicemail,
+            self.update_voice_portal,
+            self.update_outgoing_permission,
+            self.update_outgoing_auto_transfer,
+            self.update_music_on_hold,
+        )
+
+    def add_rollback_task(self, task):
+        with self._rollback_lock:
+            self.rollback_tasks.append(task)
 
     def get_current(self):
         self.current = self.lookup.location(self.model.name)
@@ -107,49 +123,59 @@ class WbxcLocationCallingSvc(WbxcBulkSvc):
                 self.model.fileName, self.model.level, self.current["id"]
             )
 
+    def update_connection_route_and_call_settings(self):
+        """
+        The connection route and call settings tasks both update the location
+        call settings endpoint, which does not allow multiple updates to the same
+        Location at once (https://github.com/cdwlabs/zeus/issues/386), so they
+        are run in sequence.
+        """
+        self.update_connection_route()
+        self.update_call_settings()
+
     def update_connection_route(self):
         task = WbxcLocationCallingConnectionTask(self)
         task.run()
-        self.rollback_tasks.append(task)
+        self.add_rollback_task(task)
 
     def update_call_settings(self):
         task = WbxcLocationCallingSettingsTask(self)
         task.run()
-        self.rollback_tasks.append(task)
+        self.add_rollback_task(task)
 
     def update_internal_dialing(self):
         task = WbxcLocationCallingInternalDialingTask(self)
         task.run()
-        self.rollback_tasks.append(task)
+        self.add_rollback_task(task)
 
     def update_voicemail(self):
         task = WbxcLocationCallingVoicemailTask(self)
         task.run()
-        self.rollback_tasks.append(task)
+        self.add_rollback_task(task)
 
     def update_voice_portal(self):
         task = WbxcLocationCallingVoicePortalTask(self)
         task.run()
-        self.rollback_tasks.append(task)
+        self.add_rollback_task(task)
 
     def update_outgoing_permission(self):
         task = WbxcLocationCallingOutgoingPermissionsTask(
             self, self.client.location_outgoing_permission
         )
         task.run()
-        self.rollback_tasks.append(task)
+        self.add_rollback_task(task)
 
     def update_outgoing_auto_transfer(self):
         task = sh.WbxcOutgoingAutoTransferUpdateTask(
             self, self.client.location_outgoing_auto_transfer
         )
         task.run()
-        self.rollback_tasks.append(task)
+        self.add_rollback_task(task)
 
     def update_music_on_hold(self):
         task = WbxcLocationCallingMusicOnHoldTask(self)
         task.run()
-        self.rollback_tasks.append(task)
+        self.add_rollback_task(task)
 
 
 @reg.bulk_service("wbxc", "location_calling", "CREATE")
@@ -551,9 +577,10 @@ class WbxcLocationCallingExportSvc(ExportSvc):
         errors = []
         lookup = WbxcLookup(self.client)
         data_type = WbxcLocationCalling.schema()["data_type"]
-        builder = WbxcLocationCallingModelBuilder(self.client)
+        builder = WbxcLocationCallingModelBuilder(self.client, lookup=lookup)
 
-        for resp in self.client.locations.list():
+        # Each location requires several requests, so fetch the next page of locations in the background
+        for resp in prefetch(self.client.locations.list()):
             if lookup.is_calling_enabled_for_location(resp["id"]):
                 try:
                     model = builder.build_model(resp)
@@ -571,9 +598,9 @@ class WbxcLocationCallingModelBuilder:
     Only calling-enabled locations are included
     """
 
-    def __init__(self, client):
+    def __init__(self, client, lookup: WbxcLookup | None = None):
         self.client: WbxcSimpleClient = client
-        self.lookup = WbxcLookup(client)
+        self.lookup = lookup or WbxcLookup(client)
 
     def build_models(self):
         models = []
@@ -589,28 +616,25 @@ class WbxcLocationCallingModelBuilder:
 
     def build_model(self, resp):
         identifier = resp["id"]
-        calling_settings = self.get_calling_settings(identifier)
-        internal_dialing = self.get_internal_dialing(identifier)
-        voicemail = self.get_voicemail(identifier)
-        voiceportal = self.get_voiceportal(identifier)
-        outgoing_permissions = self.get_outgoing_permissions(identifier)
-        outgoing_auto_transfer = self.get_outgoing_auto_transfer(identifier)
-        music_on_hold = self.get_music_on_hold(identifier)
-
-        return WbxcLocationCalling.safe_build(
-            name=resp["name"],
-            **calling_settings,
-            **internal_dialing,
-            **voicemail,
-            **voiceportal,
-            **outgoing_permissions,
-            **outgoing_auto_transfer,
-            **music_on_hold,
+        getters = (
+            self.get_calling_settings,
+            self.get_internal_dialing,
+            self.get_voicemail,
+            self.get_voiceportal,
+            self.get_outgoing_permissions,
+            self.get_outgoing_auto_transfer,
+            self.get_music_on_hold,
         )
+        # Each settings GET is independent, so make the requests concurrently
+        settings = map_concurrently(lambda get: get(identifier), getters)
+        model_data = {key: value for section in settings for key, value in section.items()}
+
+        return WbxcLocationCalling.safe_build(name=resp["name"], **model_data)
 
     def get_calling_settings(self, identifier):
         resp = self.client.location_call_settings.get(identifier)
-        connection_id = deep_get(resp, "connection.id", default="")
+        connection = resp.get("connection") or {}
+        connection_id = connection.get("id", "")
         connection_name = (
             self.lookup.routing_choice(connection_id) if connection_id else {}
         )
@@ -621,8 +645,8 @@ class WbxcLocationCallingModelBuilder:
             "enforceOutsideDialDigit": resp.get("enforceOutsideDialDigit", ""),
             "externalCallerIdName": resp.get("externalCallerIdName", ""),
             "announcementLanguage": resp.get("announcementLanguage", ""),
-            "callingLineIdPhoneNumber": deep_get(resp, "callingLineId.phoneNumber", ""),
-            "connectionType": deep_get(resp, "connection.type", ""),
+            "callingLineIdPhoneNumber": (resp.get("callingLineId") or {}).get("phoneNumber", ""),
+            "connectionType": connection.get("type", ""),
             "connectionName": connection_name.get("name", ""),
         }
 
@@ -630,8 +654,8 @@ class WbxcLocationCallingModelBuilder:
         resp = self.client.location_internal_dialing.get(identifier)
         return {
             "enableUnknownExtensionRoutePolicy": resp["enableUnknownExtensionRoutePolicy"],
-            "unknownExtensionRouteName": deep_get(
-                resp, "unknownExtensionRouteIdentity.name", default=""
+            "unknownExtensionRouteName": (
+                (resp.get("unknownExtensionRouteIdentity") or {}).get("name", "")
             ),
         }
 
@@ -658,10 +682,11 @@ class WbxcLocationCallingModelBuilder:
 
     def get_music_on_hold(self, identifier):
         resp = self.client.location_music_on_hold.get(identifier)
+        audio_file = resp.get("audioFile") or {}
         return {
             "callHoldEnabled": resp.get("callHoldEnabled", ""),
             "callParkEnabled": resp.get("callParkEnabled", ""),
             "greeting": resp.get("greeting", ""),
-            "fileName": deep_get(resp, "audioFile.fileName", default=""),
-            "level": deep_get(resp, "audioFile.level", default=""),
+            "fileName": audio_file.get("fileName", ""),
+            "level": audio_file.get("level", ""),
         }
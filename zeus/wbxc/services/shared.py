@@ -1,6 +1,10 @@
 import re
 import logging
-from typing import Optional
+from functools import lru_cache
+from threading import Thread, Event
+from queue import Queue, Full
+from typing import Optional, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from zeus.shared.helpers import deep_get
 from zeus.exceptions import ZeusBulkOpFailed
 from zeus.services import BulkSvc, BulkTask, SvcClient
@@ -9,8 +13,13 @@ from zeus.wbxc.wbxc_models.shared import validate_extension, validate_e164_phone
 
 log = logging.getLogger(__name__)
 
+# Upper limit on concurrent API requests made on behalf of a single bulk row or export
+MAX_CONCURRENT_REQUESTS = 8
+
 
 class WbxcBulkSvc(BulkSvc):
+    __slots__ = ("lookup",)
+
     def __init__(self, client, model, **kwargs):
         super().__init__(client, model, **kwargs)
         self.client: WbxcSimpleClient = client
@@ -18,6 +27,8 @@ class WbxcBulkSvc(BulkSvc):
 
 
 class WbxcBulkTask(BulkTask):
+    __slots__ = ()
+
     def __init__(self, svc, **kwargs):
         super().__init__(svc, **kwargs)
         self.svc: WbxcBulkSvc = svc
@@ -32,6 +43,9 @@ class WbxcLookup:
     def __init__(self, client):
         self.client: WbxcSimpleClient = client
         self.current: dict = {}
+        self._licenses: list[dict] | None = None
+        self._locations_by_name: dict[str, dict] = {}
+        self._calling_enabled: dict[str, bool] = {}
 
     def device(self, mac: str) -> dict:
         """
@@ -66,12 +80,16 @@ class WbxcLookup:
         Raises:
         - ZeusBulkOpFailed: If the location with the provided name does not exist.
         """
+        if name in self._locations_by_name:
+            return self._locations_by_name[name]
+
         existing_locations = self.client.locations.list()
         match = next((loc for loc in existing_locations if loc["name"] == name), None)
 
         if not match:
             raise ZeusBulkOpFailed(f"Location '{name}' Does Not Exist.")
 
+        self._locations_by_name[name] = match
         return match
 
     def number(self, **params) -> dict:
@@ -86,6 +104,60 @@ class WbxcLookup:
 
         return matches[0]
 
+    def numbers_by_any(self, numbers: Iterable[str], raise_missing: bool = True) -> dict[str, dict]:
+        """
+        Look up multiple numbers that may be phone numbers or extensions.
+
+        The numbers API cannot match a phone number OR an extension in one request,
+        so `build_number_lookup_params` may return more than one param set (10-digit values).
+        The first param set for every unique number is looked up in one concurrent batch.
+        The next param set is then looked up only for the numbers that were not found, so
+        no more requests are sent than a sequential lookup that stops at the first match.
+
+        Args:
+            numbers (Iterable): Phone numbers or extensions to look up
+            raise_missing (bool): If False, numbers that are not found are left out
+             of the returned dict instead of raising an exception
+
+        Returns:
+            dict: Number responses keyed by the provided number strings
+
+        Raises:
+            ZeusBulkOpFailed: For the first number, in the order provided, that is not found
+        """
+        unique_numbers = list(dict.fromkeys(numbers))
+        param_sets = {number: build_number_lookup_params(number) for number in unique_numbers}
+
+        matches = {}
+        pending = unique_numbers
+        attempt = 0
+        while pending:
+            lookups = [
+                (number, param_sets[number][attempt])
+                for number in pending
+                if attempt < len(param_sets[number])
+            ]
+            responses = map_concurrently(self._number_or_none, [params for _, params in lookups])
+            for (number, _), resp in zip(lookups, responses):
+                if resp:
+                    matches[number] = resp
+
+            pending = [number for number, _ in lookups if number not in matches]
+            attempt += 1
+
+        if raise_missing:
+            for number in unique_numbers:
+                if number not in matches:
+                    raise ZeusBulkOpFailed(f"Number: {number} not found.")
+
+        return {number: matches[number] for number in unique_numbers if number in matches}
+
+    def _number_or_none(self, params: dict) -> Optional[dict]:
+        try:
+            return self.number(**params)
+        except ZeusBulkOpFailed:
+            return None
+
     def device_member_by_number(self, device_id: str, location_id: str, number: str) -> dict:
         matches = list(
             self.client.device_members.search(
@@ -120,7 +192,9 @@ class WbxcLookup:
         return matches[0]
 
     def hunt_group(self, name):
-        existing = self.client.huntgroups.list()
+        # The name param limits the list to matching hunt groups. It is not an
+        # exact match, so the results are still compared to the provided name.
+        existing = self.client.huntgroups.list(name=name)
         match = next((item for item in existing if item["name"] == name), None)
 
         if not match:
@@ -163,11 +237,14 @@ class WbxcLookup:
             bool: True if calling is enabled for the location with the
              specified ID or name, False otherwise.
         """
-        try:
-            self.client.location_call_settings.get(identifier)
-            return True
-        except WbxcServerFault:
-            return False
+        if identifier not in self._calling_enabled:
+            try:
+                self.client.location_call_settings.get(identifier)
+                self._calling_enabled[identifier] = True
+            except WbxcServerFault:
+                self._calling_enabled[identifier] = False
+
+        return self._calling_enabled[identifier]
 
     def routing_choice(self, identifier: str) -> dict:
         """
@@ -454,7 +531,11 @@ class WbxcLookup:
             `Webex Calling - Professional`
             `Webex Calling - Workspaces`
         """
-        licenses = self.client.licenses.list()
+        if self._licenses is None:
+            # The org's licenses do not change during a bulk row, so only list them once
+            self._licenses = list(self.client.licenses.list())
+
+        licenses = self._licenses
 
         matches = [
             lic
@@ -1025,7 +1106,8 @@ def to_us_e164(number: str) -> str:
     )
 
 
-def build_number_lookup_params(number: str) -> list[dict]:
+@lru_cache(maxsize=4096)
+def build_number_lookup_params(number: str) -> tuple[dict, ...]:
     """
     Returns query param dictionaries for the number lookup.
 
@@ -1037,6 +1119,8 @@ def build_number_lookup_params(number: str) -> list[dict]:
     Numbers less than 10 digits will be assumed to be extensions and numbers
     greater than 10 digits or formatted as +E.164 will be assumed to be phone numbers.
     and only a single param will be returned.
+
+    Results are cached per number, so the returned param dicts should not be modified.
     """
     param_sets = []
     pn_param = dict(phoneNumber=number, numberType="NUMBER", available=False)
@@ -1057,4 +1141,73 @@ def build_number_lookup_params(number: str) -> list[dict]:
     else:
         param_sets.append(pn_param)
 
-    return param_sets
+    return tuple(param_sets)
+
+
+def map_concurrently(func: Callable, items: Iterable, max_workers: int = MAX_CONCURRENT_REQUESTS) -> list:
+    """
+    Call `func` with each item using a thread pool and return the results
+    in the same order as the items.
+
+    Intended for independent, I/O-bound API requests. If any call raises an exception,
+    it is re-raised when the results are collected, the same as a sequential loop.
+    """
+    items = list(items)
+    if len(items) < 2:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def run_concurrently(*funcs: Callable) -> list:
+    """
+    Call each function with no arguments using `map_concurrently` and return
+    the results in the same order as the functions.
+    """
+    return map_concurrently(lambda func: func(), funcs)
+
+
+def prefetch(items: Iterable, maxsize: int = 100) -> Iterator:
+    """
+    Yield the items from an iterable that is consumed by a background thread.
+
+    Intended for the paged `list` generators of the Webex client so that the next
+    page is requested while the caller is still processing the current page.
+    Up to `maxsize` items are read ahead. Exceptions raised by the iterable are
+    re-raised in the caller when reached.
+    """
+    queue = Queue(maxsize=maxsize)
+    stop = Event()
+    done = object()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(entry, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except Exception as exc:
+            put((done, exc))
+        else:
+            put((done, None))
+
+    Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item, exc = queue.get()
+            if exc is not None:
+                raise exc
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
@@ -1,6 +1,12 @@
 import re
+from functools import lru_cache
 
+dms_prefix_rgx = re.compile(r"^(dms\s)")
+ata_suffix_rgx = re.compile(r"(\sata)$")
+cisco_prefix_rgx = re.compile(r"^(cisco\s)")
 
+
+@lru_cache(maxsize=512)
 def normalized_model(device_model: str):
     """
     Convert WbxcDevice.model value to a format that
@@ -9,11 +15,14 @@ def normalized_model(device_model: str):
 
     This removes 'Cisco' and 'DMS' from the front of the model name
     and 'ATA' from the end.
+
+    Results are cached as bulk jobs and exports normalize the
+    same handful of model strings for every device.
     """
     norm = str(device_model).lower()
-    norm = re.sub(r"^(dms\s)", "", norm)
-    norm = re.sub(r"(\sata)$", "", norm)
-    return re.sub(r"^(cisco\s)", "", norm)
+    norm = dms_prefix_rgx.sub("", norm)
+    norm = ata_suffix_rgx.sub("", norm)
+    return cisco_prefix_rgx.sub("", norm)
 
 
 def build_supported_devices_map(supported_device_resp=None):
@@ -21,6 +30,9 @@ def build_supported_devices_map(supported_device_resp=None):
     Create a dictionary of the supported devices response
     keyed by a normalized format of the model name to allow
     some flexibility in the workbooks model value.
+
+    The `kemModuleType` list is converted to a frozenset so
+    expansion module support checks are set lookups.
     """
     supported_device_resp = supported_device_resp or SUPPORTED_DEVICE_DATA
     device_map = {}
@@ -29,11 +41,47 @@ def build_supported_devices_map(supported_device_resp=None):
     for item in resp_devices:
         if "model" in item:
             key = normalized_model(item["model"])
-            device_map[key] = item
+            device_map[key] = {**item, "kemModuleType": frozenset(item.get("kemModuleType", []))}
 
     return device_map
 
 
+@lru_cache(maxsize=1)
+def supported_devices_map() -> dict:
+    """
+    Return the supported devices map built from SUPPORTED_DEVICE_DATA.
+    The data is static, so the map is built once per process.
+    """
+    return build_supported_devices_map()
+
+
+@lru_cache(maxsize=1)
+def device_settings_models() -> frozenset:
+    """
+    Return the normalized names of phone models that support customizable
+    device settings based on deviceSettingsConfiguration == WEBEX_CALLING_DEVICE_CONFIGURATION
+    in the supported devices data.
+    """
+    return frozenset(
+        model
+        for model, details in supported_devices_map().items()
+        if details.get("deviceSettingsConfiguration") == "WEBEX_CALLING_DEVICE_CONFIGURATION"
+    )
+
+
+@lru_cache(maxsize=256)
+def number_of_line_key_buttons(device_model: str, default: int = 10) -> int:
+    """
+    Return the numberOfLineKeyButtons for the device model from the
+    supported devices map or `default` if the model is not found.
+
+    The default of 10 is a best guess. This may not be accurate but,
+    for exports, it is better than failing.
+    """
+    model_data = supported_devices_map().get(normalized_model(device_model), {})
+    return model_data.get("numberOfLineKeyButtons", default)
+
+
 # Values taken from https://developer.webex.com/docs/api/v1/device-call-settings/read-the-list-of-supported-devices
 # This avoids a separate call to that API for each device
 SUPPORTED_DEVICE_DATA = {
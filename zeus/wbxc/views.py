@@ -214,7 +214,7 @@ class WbxcBulkSubmitGreetingsView(WbxcBulkSubmitView):
 
 def wbxc_org_credentials(org_id) -> dict:
     token_mgr = WbxcTokenMgr()
-    org = current_user.active_org(TOOL, org_id)
+    org = current_user.active_org(TOOL, org_id, with_oauth=True)
     try:
         return dict(
             access_token=token_mgr.access_token(org=org),
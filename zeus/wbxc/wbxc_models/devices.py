@@ -1,5 +1,6 @@
 import re
 from copy import deepcopy
+from functools import lru_cache
 from pydantic import Field, validator, BaseModel, root_validator
 from zeus import registry as reg
 from zeus.shared import data_type_models as dm
@@ -94,10 +95,14 @@ class WbxcDeviceLine(BaseModel):
         return payload
 
     @classmethod
+    @lru_cache(maxsize=None)
     def indexed_wb_keys(cls, idx: int) -> dict:
         """
         Return a dictionary with wb_keys using the provided idx integer
         as keys and the associated field as values
+
+        Cached since it is called for every line of every uploaded row.
+        The returned dict should not be modified.
         """
         field_by_indexed_wb_key = {}
         for field in cls.__fields__.values():
@@ -2,8 +2,16 @@ from flask import current_app
 from flask_login import current_user
 from zeus.exceptions import ZeusCmdError
 from zeus.models import OAuthApp, OrgType
-from wtforms.validators import DataRequired
-from wtforms import Form, StringField, SelectField
+from wtforms.validators import DataRequired, Optional
+from wtforms import Form, IntegerField, StringField, SelectField
+
+
+class _WxccOrgForm(Form):
+    id = IntegerField("Org Id", validators=[Optional()], render_kw={"hidden": ""})
+    name = StringField(
+        "Name", validators=[DataRequired("Org Name is Required")], default=""
+    )
+    oauth_app = SelectField("OAuth App", choices=[], coerce=int)
 
 
 def WxccOrgForm(*args, **kwargs):
@@ -13,18 +21,9 @@ def WxccOrgForm(*args, **kwargs):
     For Wxcc, all orgs are expected to use the system default
     OAuth App so the select field only contains one item
     """
-
-    choices = get_wxcc_oauth_choices()
-
-    class _WxccOrgForm(Form):
-
-        id = StringField("Org Id", render_kw={"hidden": ""})
-        name = StringField(
-            "Name", validators=[DataRequired("Org Name is Required")], default=""
-        )
-        oauth_app = SelectField("OAuth App", choices=choices)
-
-    return _WxccOrgForm(*args, **kwargs)
+    form = _WxccOrgForm(*args, **kwargs)
+    form.oauth_app.choices = get_wxcc_oauth_choices()
+    return form
 
 
 def get_wxcc_oauth_choices() -> list[tuple[int, str]]:
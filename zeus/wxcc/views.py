@@ -143,7 +143,7 @@ class WxccBulkSubmitView(vw.BulkSubmitView):
 
 def wxcc_org_credentials(org_id) -> dict:
     token_mgr = WxccTokenMgr()
-    org = current_user.active_org(TOOL, org_id)
+    org = current_user.active_org(TOOL, org_id, with_oauth=True)
     try:
         return dict(
             access_token=token_mgr.access_token(org=org),
@@ -1,9 +1,17 @@
 from flask_login import current_user
-from wtforms import Form, StringField, SelectField
-from wtforms.validators import DataRequired
+from wtforms import Form, IntegerField, StringField, SelectField
+from wtforms.validators import DataRequired, Optional
 from zeus.exceptions import ZeusCmdError
 
 
+class _ZoomOrgForm(Form):
+    id = IntegerField("Org Id", validators=[Optional()], render_kw={"hidden": ""})
+    name = StringField(
+        "Name", validators=[DataRequired("Org Name is Required")], default=""
+    )
+    oauth_app = SelectField("OAuth App", choices=[], coerce=int)
+
+
 def ZoomOrgForm(*args, **kwargs):
     """
     Build an OAuth-enabled organization form.
@@ -11,16 +19,9 @@ def ZoomOrgForm(*args, **kwargs):
     For Zoom, users should be allowed to choose global apps
     or Oauth apps they've created.
     """
-    choices = get_zoom_oauth_choices()
-
-    class _ZoomOrgForm(Form):
-        id = StringField("Org Id", render_kw={"hidden": ""})
-        name = StringField(
-            "Name", validators=[DataRequired("Org Name is Required")], default=""
-        )
-        oauth_app = SelectField("OAuth App", choices=choices)
-
-    return _ZoomOrgForm(*args, **kwargs)
+    form = _ZoomOrgForm(*args, **kwargs)
+    form.oauth_app.choices = get_zoom_oauth_choices()
+    return form
 
 
 def get_zoom_oauth_choices() -> list[tuple[int, str]]:
@@ -146,7 +146,7 @@ class ZoomBulkSubmitView(vw.BulkSubmitView):
 
 def zoom_org_credentials(org_id) -> dict:
     token_mgr = ZoomTokenMgr()
-    org = current_user.active_org(TOOL, org_id)
+    org = current_user.active_org(TOOL, org_id, with_oauth=True)
     try:
         return dict(
             access_token=token_mgr.access_token(org=org),
@@ -1,11 +1,19 @@
 from flask import current_app
 from flask_login import current_user
-from wtforms import Form, StringField, SelectField
-from wtforms.validators import DataRequired
+from wtforms import Form, IntegerField, StringField, SelectField
+from wtforms.validators import DataRequired, Optional
 from zeus.exceptions import ZeusCmdError
 from zeus.models import OAuthApp, OrgType
 
 
+class _ZoomCCOrgForm(Form):
+    id = IntegerField("Org Id", validators=[Optional()], render_kw={"hidden": ""})
+    name = StringField(
+        "Name", validators=[DataRequired("Org Name is Required")], default=""
+    )
+    oauth_app = SelectField("OAuth App", choices=[], coerce=int)
+
+
 def ZoomCCOrgForm(*args, **kwargs):
     """
     Build an OAuth-enabled organization form.
@@ -13,16 +21,9 @@ def ZoomCCOrgForm(*args, **kwargs):
     For ZoomCC, users should be allowed to choose global apps
     or Oauth apps they've created.
     """
-    choices = get_zoomcc_oauth_choices()
-
-    class _ZoomCCOrgForm(Form):
-        id = StringField("Org Id", render_kw={"hidden": ""})
-        name = StringField(
-            "Name", validators=[DataRequired("Org Name is Required")], default=""
-        )
-        oauth_app = SelectField("OAuth App", choices=choices)
-
-    return _ZoomCCOrgForm(*args, **kwargs)
+    form = _ZoomCCOrgForm(*args, **kwargs)
+    form.oauth_app.choices = get_zoomcc_oauth_choices()
+    return form
 
 
 def get_zoomcc_oauth_choices() -> list[tuple[int, str]]:
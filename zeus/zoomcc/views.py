@@ -135,7 +135,7 @@ class ZoomCCBulkSubmitView(vw.BulkSubmitView):
 
 def zoomcc_org_credentials(org_id) -> dict:
     token_mgr = ZoomTokenMgr()
-    org = current_user.active_org(f"{TOOL}", org_id)
+    org = current_user.active_org(f"{TOOL}", org_id, with_oauth=True)
     try:
         return dict(
             access_token=token_mgr.access_token(org=org),